@@ -1,29 +1,39 @@
 # pyright: reportUnknownMemberType=false, reportAttributeAccessIssue=false, reportUnknownArgumentType=false, reportUnknownParameterType=false, reportMissingParameterType=false
 
+import argparse
+import atexit
+import copy
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+import operator
 import os
+import queue
 import signal
+import socket
 import sys
-from typing import final
+import time
+from typing import TYPE_CHECKING, final, override
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QSocketNotifier, QThreadPool, QTimer
 from PySide6.QtWidgets import QApplication
-from qt_material import apply_stylesheet
 
-from overlay.core.config import APP_NAME, user_data_dir, load_config, save_config
-from overlay.core.hotkey_manager import HotkeyManager
-from overlay.core.ipc_listener import IpcListener
+from overlay.core.config import APP_NAME, APP_VERSION, user_data_dir, load_config, save_config
 from overlay.core.models import AppConfig
 from overlay.core.spotify_client import SpotifyClient
 from overlay.ui.overlay_window import OverlayWindow
-from overlay.ui.setup_window import SetupWindow
+from overlay.ui.theme import apply_theme
 from overlay.ui.tray_icon import TrayIcon
 
+if TYPE_CHECKING:
+    from overlay.ui.setup_window import SetupWindow
+
 
 APP_DISPLAY_NAME = "Spoverlay"
-IPC_SOCKET_PATH = f"/tmp/{APP_NAME}.sock"
-TRAY_ICON_PATH = os.path.join("assets", "tray-icon.jpg")
+APP_THEME = "dark_cyan.xml"
+IPC_SOCKET_NAME = APP_NAME
+CONFIG_SAVE_DEBOUNCE_MS = 250
+CONFIG_RELOAD_DEBOUNCE_MS = 200
+LOG_FILE_BUFFER_CAPACITY = 64
 
 log = logging.getLogger(__name__)
 
@@ -34,42 +44,71 @@ class SpoverlayApp(QObject):
     Manages the lifecycle of the entire Spoverlay application and its components.
     """
 
-    def __init__(self):
+    # (signal, slot) attribute paths wired up by _connect_signals.
+    _SIGNAL_WIRING = (
+        ("tray_icon.config_saved", "_on_config_changed"),
+        ("spotify_client.clear_ui_requested", "overlay_window.clear_ui"),
+        ("spotify_client.now_playing_updated", "overlay_window.set_now_playing"),
+    )
+
+    def __init__(self, app: QApplication):
         super().__init__()
-        log.info("Starting initialization.")
+        log.debug("Starting initialization.")
+        self._app = app
+
         self.config = self._load_initial_config()
-        log.info("Initial configuration has been loaded.")
 
-        self.setup_window = SetupWindow()
-        log.info("SetupWindow is ready if needed.")
+        # Only built if the setup wizard is actually needed.
+        self.setup_window: SetupWindow | None = None
 
         self.overlay_window = OverlayWindow(self.config)
-        log.info("OverlayWindow has been created with the initial configuration.")
+        log.debug("OverlayWindow has been created with the initial configuration.")
 
         self.spotify_client = SpotifyClient(self.config)
-        log.info("SpotifyClient has been created with the initial configuration.")
+        log.debug("SpotifyClient has been created with the initial configuration.")
 
-        icon_path = os.path.join(self.config.app_directory, TRAY_ICON_PATH)
-        if not os.path.exists(icon_path):
+        icon_path = self.config.tray_icon_path
+        if not self.config.icon_exists:
             log.warning(f"Icon not found at {icon_path}, tray may not have an icon.")
 
         self.tray_icon = TrayIcon(APP_DISPLAY_NAME, icon_path, self.overlay_window, self.spotify_client, self.config)
-        log.info("TrayIcon has been initialized.")
+        log.debug("TrayIcon has been initialized.")
 
         # These will be initialized based on the platform
         self.hotkey_manager = None
         self.ipc_listener = None
 
+        self._signal_read_sock: socket.socket
+        self._signal_write_sock: socket.socket
+        self._signal_notifier: QSocketNotifier
+
+        # Rapid config changes are coalesced into a single write.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(CONFIG_SAVE_DEBOUNCE_MS)
+        _ = self._save_timer.timeout.connect(self._save_config_in_background)
+
+        # Saves run on their own single-thread pool, so they never overlap and
+        # shutdown only has to wait for them.
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+        # The poller and the hotkey listener are only reloaded once a burst of
+        # changes has settled, restarting them is far costlier than a repaint.
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(CONFIG_RELOAD_DEBOUNCE_MS)
+        _ = self._reload_timer.timeout.connect(self._reload_services)
+
         self._setup_platform_integrations()
         self._connect_signals()
         self._setup_shutdown_hooks()
+        log.info("Initialized: config, overlay_window, spotify_client, tray_icon.")
 
     def _load_initial_config(self) -> AppConfig:
         try:
-            log.info("Loading overlay configuration...")
-
             config = load_config()
-            log.info("Overlay configuration loaded.")
+            log.debug("Overlay configuration loaded.")
 
             return config
         except Exception:
@@ -79,15 +118,21 @@ class SpoverlayApp(QObject):
     def _launch_setup_wizard(self):
         """Opens the setup dialog."""
 
-        _ = self.setup_window.client_id_saved.connect(self._on_setup_completed)
+        if self.setup_window is None:
+            from overlay.ui.setup_window import SetupWindow
+
+            self.setup_window = SetupWindow()
+
+        _ = self.setup_window.accepted.connect(self._on_setup_completed)
         _ = self.setup_window.rejected.connect(self._on_setup_cancelled)
-        log.info("SetupWizard hooks are connected.")
+        log.debug("SetupWizard hooks are connected.")
 
         self.setup_window.show()
 
-    def _on_setup_completed(self, client_id: str):
+    def _on_setup_completed(self):
         """Called when user saves a valid Client ID."""
 
+        client_id = self.setup_window.client_id
         log.info("Setup completed. Saving configuration and starting...")
 
         self.config.client.client_id = client_id
@@ -100,7 +145,7 @@ class SpoverlayApp(QObject):
         """User closed the setup window without saving."""
 
         log.info("Setup cancelled by user. Exiting.")
-        QApplication.instance().quit()  # pyright: ignore[reportOptionalMemberAccess]
+        self._app.quit()
 
     def _start_normal_operation(self):
         """Proceeds with normal startup flow."""
@@ -116,12 +161,16 @@ class SpoverlayApp(QObject):
 
         if sys.platform == "linux":
             log.info("Setting up IPC listener for Linux.")
+            from overlay.core.ipc_listener import IpcListener
 
-            self.ipc_listener = IpcListener(IPC_SOCKET_PATH)
+            self.ipc_listener = IpcListener(IPC_SOCKET_NAME)
             _ = self.ipc_listener.toggle_visibility_requested.connect(self.tray_icon.toggle_visibility)
             self.ipc_listener.start()
         else:
             log.info(f"Setting up global hotkey for {sys.platform}.")
+            # pynput probes the display server as soon as it is imported, so only
+            # pay for it on platforms that actually use the hotkey manager.
+            from overlay.core.hotkey_manager import HotkeyManager
             try:
                 self.hotkey_manager = HotkeyManager(self.config)
                 _ = self.hotkey_manager.hotkey_triggered.connect(self.tray_icon.toggle_visibility)
@@ -133,25 +182,34 @@ class SpoverlayApp(QObject):
     def _connect_signals(self):
         """Connects all the application's internal signals and slots."""
 
-        _ = self.tray_icon.configure_window.config_saved.connect(self._on_config_changed)
-        log.info("ConfigureWindow signal '_on_config_changed' has been connected.")
-
-        _ = self.spotify_client.clear_ui_requested.connect(self.overlay_window.clear_ui)
-        log.info("SpotifyClient signal 'clear_ui' has been connected.")
+        for signal_path, slot_path in self._SIGNAL_WIRING:
+            _ = operator.attrgetter(signal_path)(self).connect(operator.attrgetter(slot_path)(self))
 
-        _ = self.spotify_client.now_playing_updated.connect(self.overlay_window.set_now_playing)
-        log.info("SpotifyClient signal 'set_now_playing' has been connected.")
-
-        log.info("Application signals connected.")
+        log.debug("Application signals connected.")
 
     def _setup_shutdown_hooks(self):
         """Sets up handlers for graceful application shutdown."""
 
-        QApplication.instance().aboutToQuit.connect(self._on_about_to_quit)  # pyright: ignore[reportUnusedCallResult, reportOptionalMemberAccess]
-        _ = signal.signal(signal.SIGINT, self._on_os_signal)
-        _ = signal.signal(signal.SIGTERM, self._on_os_signal)
+        _ = self._app.aboutToQuit.connect(self._on_about_to_quit)
+
+        # While Qt's event loop is running no Python code executes, so a Python
+        # signal handler would not run until something else wakes the interpreter.
+        # Instead, the C-level handler writes the signal number to a wakeup socket
+        # that is watched by the event loop itself.
+        self._signal_read_sock, self._signal_write_sock = socket.socketpair()
+        self._signal_read_sock.setblocking(False)
+        self._signal_write_sock.setblocking(False)
+        _ = signal.set_wakeup_fd(self._signal_write_sock.fileno())
+
+        self._signal_notifier = QSocketNotifier(self._signal_read_sock.fileno(), QSocketNotifier.Type.Read, self)
+        _ = self._signal_notifier.activated.connect(self._on_os_signal)
 
-        log.info("Shutdown hooks registered.")
+        # Python handlers are still required for the wakeup fd to be written,
+        # they just don't need to do anything.
+        _ = signal.signal(signal.SIGINT, lambda *_args: None)
+        _ = signal.signal(signal.SIGTERM, lambda *_args: None)
+
+        log.debug("Shutdown hooks registered.")
 
     def run(self):
         """Starts the application's main processes."""
@@ -167,22 +225,45 @@ class SpoverlayApp(QObject):
 
         log.info("Configuration changed, applying new settings...")
         self.config = new_config
-        save_config(self.config)
+        self._save_timer.start()
 
         self.overlay_window.on_config_changed(self.config)
+        self._reload_timer.start()
+
+        log.info("Settings applied successfully.")
+
+    def _reload_services(self):
+        """Pushes the latest config to the background services."""
+
         self.spotify_client.on_config_changed(self.config)
 
         if self.hotkey_manager:
             self.hotkey_manager.on_config_changed(self.config)
 
-        log.info("Settings applied and saved successfully.")
+    def _save_config_in_background(self):
+        """Writes the current config to disk on a pool thread, keeping the UI responsive."""
+
+        # The pool thread gets its own copy, since the configure window edits self.config in place.
+        config = copy.deepcopy(self.config)
+        self._save_pool.start(lambda: save_config(config))
 
     def _on_about_to_quit(self):
         """Cleans up all resources before the application exits."""
 
         log.info("Shutdown sequence initiated...")
+
+        # No new polls are scheduled from here on.
         self.spotify_client.stop()
 
+        # Let an in-flight save land first, so it can't replace the newer flushed one.
+        _ = self._save_pool.waitForDone()
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            save_config(self.config)
+
+        self.spotify_client.close()
+        self.overlay_window.stop_art_loader()
+
         if self.hotkey_manager:
             self.hotkey_manager.stop_listener()
 
@@ -195,22 +276,67 @@ class SpoverlayApp(QObject):
     def _on_os_signal(self, *_args):
         """Handles OS signals like Ctrl+C for a graceful exit."""
 
+        try:
+            _ = self._signal_read_sock.recv(64)
+        except BlockingIOError:
+            return
+
         log.info("OS shutdown signal received, quitting application.")
-        QApplication.instance().quit()  # pyright: ignore[reportOptionalMemberAccess]
+        self._app.quit()
+
+
+@final
+class LogFormatter(logging.Formatter):
+    """
+    Formats records as '<time> <level> <name>: <message>'. The second-resolution
+    part of the timestamp is only rendered once per second and reused.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._cached_second = -1
+        self._cached_timestamp = ""
+
+    @override
+    def format(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_timestamp = time.strftime(self.default_time_format, self.converter(record.created))
+
+        message = f"{self._cached_timestamp},{int(record.msecs):03d} {record.levelname} {record.name}: {record.getMessage()}"
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self.formatStack(record.stack_info)}"
+        return message
 
 
 def setup_logging():
-    """Configures logging to output to both console and log file."""
+    """
+    Configures logging to output to both console and log file. Records are
+    handed to a background QueueListener so the actual writes happen off the
+    main thread.
+    """
 
-    log_formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # None of these LogRecord fields are part of the output.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    log_formatter = LogFormatter()
 
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(log_formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
+    file_logging_error = None
     try:
         data_dir = user_data_dir()
         os.makedirs(data_dir, exist_ok=True)
@@ -219,24 +345,50 @@ def setup_logging():
         # Create a rotating file handler. 1MB per file, keeping 5 old files
         file_handler = RotatingFileHandler(log_file_path, maxBytes=1 * 1024 * 1024, backupCount=5)
         file_handler.setFormatter(log_formatter)
-        root_logger.addHandler(file_handler)
+
+        # Batch file writes; anything at WARNING or above is flushed right away,
+        # and logging's own shutdown hook flushes the rest on exit.
+        buffered_file_handler = MemoryHandler(LOG_FILE_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler, flushOnClose=True)
+        handlers.append(buffered_file_handler)
     except Exception as e:
-        root_logger.error(f"Failed to set up file logging: {e}")
+        file_logging_error = e
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued on every exit path, including sys.exit().
+    atexit.register(listener.stop)
+
+    if file_logging_error:
+        root_logger.error(f"Failed to set up file logging: {file_logging_error}")
+
+
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    """Parses the app's own arguments, leaving the rest for Qt."""
+
+    parser = argparse.ArgumentParser(prog=APP_NAME.lower(), description="A lightweight overlay for Spotify.")
+    _ = parser.add_argument("--version", action="version", version=f"{APP_DISPLAY_NAME} {APP_VERSION}")
+    return parser.parse_known_args()
 
 
 def main() -> None:
+    # Handled before any Qt setup so '--help'/'--version' never load a platform plugin.
+    _, qt_args = parse_args()
+
     setup_logging()
     log.info(f"--- Starting {APP_DISPLAY_NAME} ---")
 
-    app = QApplication(sys.argv)
+    app = QApplication([sys.argv[0], *qt_args])
     app.setQuitOnLastWindowClosed(False)
     app.setApplicationName(APP_NAME)
     app.setApplicationDisplayName(APP_DISPLAY_NAME)
 
-    extra = {"density_scale": "-1"}
-    apply_stylesheet(app, "dark_cyan.xml", invert_secondary=False, extra=extra)
+    # Styling is applied on the first event loop tick so the windows can appear sooner.
+    QTimer.singleShot(0, lambda: apply_theme(app, APP_THEME, user_data_dir()))
 
-    spoverlay_app = SpoverlayApp()
+    spoverlay_app = SpoverlayApp(app)
     spoverlay_app.run()
 
     log.info("Entering Qt main event loop...")
@@ -1,23 +1,57 @@
 # pyright: reportAny=false, reportUnknownMemberType=false
 
+from dataclasses import asdict
+import functools
+import hashlib
 import logging
 import os
+import pickle
 import sys
-
-import toml
+import tempfile
+import tomllib
 
 from overlay.core.models import AppConfig, SpotifyConfig, UIConfig
 
 
 APP_NAME = "Spoverlay"
+APP_VERSION = "1.0.0"
 CONFIG_FILE_NAME = "config.toml"
+CONFIG_CACHE_FILE_NAME = "config.cache.pkl"
+# Bump whenever the config models change so stale caches are ignored.
+CONFIG_CACHE_VERSION = 5
 DEFAULT_SPOTIFY_REDIRECT_URI = "http://127.0.0.1:8080/callback"
 DEFAULT_SPOTIFY_POLL_INTERVAL = 1000
+DEFAULT_SPOTIFY_MAX_POLL_INTERVAL = 30000
 DEFAULT_HOTKEY = "F7"
+TRAY_ICON_PATH = os.path.join("assets", "tray-icon.jpg")
+APP_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
 log = logging.getLogger(__name__)
 
-
+# (key, type) pairs read from each section of the config file.
+_UI_SCHEMA: tuple[tuple[str, type], ...] = (
+    ("position", str),
+    ("margin", int),
+    ("art_size", int),
+    ("click_through", bool),
+    ("hotkey", str),
+)
+_CLIENT_SCHEMA: tuple[tuple[str, type], ...] = (
+    ("client_id", str),
+    ("redirect_uri", str),
+    ("poll_interval_ms", int),
+    ("max_poll_interval_ms", int),
+)
+
+# Identifies the inputs a cached config was built from: install directory, config
+# path, config mtime_ns and size, and the tray icon's mtime_ns (None if missing).
+_CacheKey = tuple[str, str, int, int, int | None]
+
+# Digest of the last bytes written to each config path, with the file's mtime_ns and size after the write.
+_SAVED_DIGESTS: dict[str, tuple[bytes, int, int]] = {}
+
+
+@functools.cache
 def user_data_dir() -> str:
     home = os.path.expanduser("~")
     if sys.platform.startswith("win"):
@@ -28,7 +62,7 @@ def user_data_dir() -> str:
 
 
 def get_default_config() -> AppConfig:
-    app_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    app_directory = APP_DIRECTORY
     data_directory = user_data_dir()
 
     return AppConfig(
@@ -36,38 +70,117 @@ def get_default_config() -> AppConfig:
             client_id="",
             redirect_uri=DEFAULT_SPOTIFY_REDIRECT_URI,
             poll_interval_ms=DEFAULT_SPOTIFY_POLL_INTERVAL,
+            max_poll_interval_ms=DEFAULT_SPOTIFY_MAX_POLL_INTERVAL,
         ),
         ui=UIConfig(position="top-right", margin=24, click_through=True, art_size=64, hotkey=DEFAULT_HOTKEY),
         app_directory=app_directory,
         data_directory=data_directory,
         config_path=os.path.join(data_directory, CONFIG_FILE_NAME),
+        tray_icon_path=os.path.join(app_directory, TRAY_ICON_PATH),
     )
 
 
 def save_config(config: AppConfig):
-    config_to_save = {
-        "client": {
-            "client_id": config.client.client_id,
-            "redirect_uri": config.client.redirect_uri,
-            "poll_interval_ms": config.client.poll_interval_ms,
-        },
-        "ui": {
-            "position": config.ui.position,
-            "margin": config.ui.margin,
-            "click_through": config.ui.click_through,
-            "art_size": config.ui.art_size,
-            "hotkey": config.ui.hotkey,
-        },
-    }
+    # Only needed when writing; most launches never save.
+    import tomli_w
+
+    # Only the [client] and [ui] sections live in the file; the path and icon
+    # fields on AppConfig are derived at load time.
+    config_to_save = {"client": asdict(config.client), "ui": asdict(config.ui)}
+
+    new_bytes = tomli_w.dumps(config_to_save).encode("utf-8")
+    digest = hashlib.blake2b(new_bytes, digest_size=16).digest()
+
+    # Skip the write if we already wrote these exact bytes and nobody touched the file since.
+    saved = _SAVED_DIGESTS.get(config.config_path)
+    if saved:
+        try:
+            st = os.stat(config.config_path)
+            if saved == (digest, st.st_mtime_ns, st.st_size):
+                log.info("Configuration unchanged, skipping save.")
+                return
+        except FileNotFoundError:
+            pass
 
     try:
         os.makedirs(os.path.dirname(config.config_path), exist_ok=True)
-        with open(config.config_path, "w") as f:
-            _ = toml.dump(config_to_save, f)
+        _write_atomically(config.config_path, new_bytes)
+
+        st = os.stat(config.config_path)
+        _SAVED_DIGESTS[config.config_path] = (digest, st.st_mtime_ns, st.st_size)
     except (IOError, OSError) as e:
         log.error(f"Failed to save configuration to {config.config_path}: {e}")
 
 
+def _write_atomically(path: str, data: bytes):
+    """
+    Writes data to a private temporary file next to path, then renames it over
+    path. A crash mid-write never leaves a truncated file behind, and concurrent
+    writers never share a temporary file.
+    """
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _ = f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_cached_config(cache_path: str, key: _CacheKey) -> AppConfig | None:
+    """
+    Returns the cached config if it was built from the same install and the
+    same version of the config file (matching path, mtime and size), otherwise None.
+    """
+
+    try:
+        with open(cache_path, "rb") as f:
+            cache_version, cached_key, cached_config = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f"Failed to read config cache, falling back to a full parse. Error: {e}")
+        return None
+
+    if cache_version != CONFIG_CACHE_VERSION or cached_key != key or not isinstance(cached_config, AppConfig):
+        return None
+    return cached_config
+
+
+def _write_config_cache(cache_path: str, key: _CacheKey, config: AppConfig):
+    """Atomically writes the parsed config next to the config file."""
+
+    try:
+        data = pickle.dumps((CONFIG_CACHE_VERSION, key, config), protocol=pickle.HIGHEST_PROTOCOL)
+        _write_atomically(cache_path, data)
+    except (IOError, OSError, pickle.PickleError) as e:
+        log.warning(f"Failed to write config cache to {cache_path}: {e}")
+
+
+def _apply_section(target: object, section: object, schema: tuple[tuple[str, type], ...], section_name: str):
+    """
+    Copies the values of one config file section onto a config object. Each key
+    is converted on its own, so one invalid value only falls back to its default.
+    """
+
+    if not isinstance(section, dict):
+        return
+
+    for key, caster in schema:
+        raw = section.get(key)  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+        if raw is None:
+            continue
+        try:
+            setattr(target, key, caster(raw))
+        except (ValueError, TypeError):
+            log.warning(f"Invalid value for '{key}' in '{section_name}' section of config, using the default.")
+
+
 def load_config() -> AppConfig:
     """
     Loads configuration from the user's file, safely falling back to defaults
@@ -78,40 +191,43 @@ def load_config() -> AppConfig:
     config = get_default_config()
 
     # Create the config file from defaults if it's missing.
-    if not os.path.exists(config.config_path):
+    try:
+        st = os.stat(config.config_path)
+    except FileNotFoundError:
+        config.icon_exists = os.path.exists(config.tray_icon_path)
         save_config(config)
         return config
 
+    # Skip parsing entirely if the file hasn't changed since it was last cached.
+    # The install location and the tray icon's stat are part of the key, so the
+    # cached asset check is redone whenever the app is moved or the icon changes.
+    try:
+        icon_mtime_ns = os.stat(config.tray_icon_path).st_mtime_ns
+    except OSError:
+        icon_mtime_ns = None
+    cache_path = os.path.join(config.data_directory, CONFIG_CACHE_FILE_NAME)
+    cache_key = (config.app_directory, config.config_path, st.st_mtime_ns, st.st_size, icon_mtime_ns)
+    cached_config = _load_cached_config(cache_path, cache_key)
+    if cached_config is not None:
+        log.info("Loaded configuration from cache.")
+        return cached_config
+
+    config.icon_exists = icon_mtime_ns is not None
+
     """
     Load from the file, but don't crash, just use default values.
     This allows the user to access the configuration window, where
     he can attempt again to change the settings.
     """
     try:
-        with open(config.config_path, "r") as f:
-            user_config = toml.load(f)
-    except toml.TomlDecodeError as e:
+        with open(config.config_path, "rb") as f:
+            user_config = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
         log.warning(f"Failed to decode config file, using defaults. Error: {e}")
         return config
 
-    ui_section = user_config.get("ui", {})
-    if isinstance(ui_section, dict):
-        try:
-            config.ui.position = str(ui_section.get("position", config.ui.position))  # pyright: ignore[reportUnknownArgumentType]
-            config.ui.margin = int(ui_section.get("margin", config.ui.margin))  # pyright: ignore[reportUnknownArgumentType]
-            config.ui.art_size = int(ui_section.get("art_size", config.ui.art_size))  # pyright: ignore[reportUnknownArgumentType]
-            config.ui.click_through = bool(ui_section.get("click_through", config.ui.click_through))  # pyright: ignore[reportUnknownArgumentType]
-            config.ui.hotkey = str(ui_section.get("hotkey", config.ui.hotkey))  # pyright: ignore[reportUnknownArgumentType]
-        except (ValueError, TypeError):
-            log.warning("Invalid value in 'ui' section of config, using defaults for affected keys.")
-
-    client_section = user_config.get("client", {})
-    if isinstance(client_section, dict):
-        try:
-            config.client.client_id = str(client_section.get("client_id", config.client.client_id))  # pyright: ignore[reportUnknownArgumentType]
-            config.client.redirect_uri = str(client_section.get("redirect_uri", config.client.redirect_uri))  # pyright: ignore[reportUnknownArgumentType]
-            config.client.poll_interval_ms = int(user_config.get("poll_interval_ms", config.client.poll_interval_ms))
-        except (ValueError, TypeError):
-            log.warning("Invalid value in 'client' section of config, using defaults for affected keys.")
+    _apply_section(config.ui, user_config.get("ui", {}), _UI_SCHEMA, "ui")
+    _apply_section(config.client, user_config.get("client", {}), _CLIENT_SCHEMA, "client")
 
+    _write_config_cache(cache_path, cache_key, config)
     return config
@@ -1,5 +1,6 @@
+import functools
 import logging
-from threading import Thread
+import sys
 from typing import final
 
 from PySide6.QtCore import QObject, Signal
@@ -10,9 +11,57 @@ from overlay.core.models import AppConfig
 
 DEFAULT_HOTKEY = "F7"
 
+# Names the hotkey recorder writes that pynput knows under a different name.
+KEY_ALIASES = {"win": "cmd"}
+
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _to_pynput_hotkey(hotkey_str: str) -> str | None:
+    """
+    Translates a normalized hotkey string into pynput's syntax, or returns
+    None if pynput does not recognise one of its keys.
+    """
+
+    # Single characters are used as-is, named keys (e.g., 'f7', 'ctrl') are wrapped in <>.
+    pynput_hotkey = "+".join(part if len(part) == 1 else f"<{KEY_ALIASES.get(part, part)}>" for part in hotkey_str.split("+"))
+
+    try:
+        _ = keyboard.HotKey.parse(pynput_hotkey)
+    except ValueError:
+        return None
+
+    return pynput_hotkey
+
+
+@functools.lru_cache(maxsize=32)
+def _win32_vk_codes(pynput_hotkey: str) -> frozenset[int] | None:
+    """
+    Collects the Win32 virtual-key codes the low-level hook reports for the
+    keys of a hotkey, including both sides of each modifier. Returns None if
+    a key has no fixed code (e.g. punctuation, whose code depends on layout).
+    """
+
+    vk_codes: set[int] = set()
+    for key in keyboard.HotKey.parse(pynput_hotkey):
+        if isinstance(key, keyboard.KeyCode):
+            char = key.char or ""
+            if not char.isascii() or not char.isalnum():
+                return None
+
+            # Letters and digits map to the code of their uppercase character.
+            vk_codes.add(ord(char.upper()))
+            continue
+
+        for name in (key.name, f"{key.name}_l", f"{key.name}_r"):
+            variant = getattr(keyboard.Key, name, None)
+            if variant is not None and variant.value.vk is not None:
+                vk_codes.add(variant.value.vk)
+
+    return frozenset(vk_codes)
+
+
 @final
 class HotkeyManager(QObject):
     """
@@ -25,60 +74,49 @@ class HotkeyManager(QObject):
     def __init__(self, config: AppConfig):
         super().__init__()
         self._config = config
-        self._target_keys: set[keyboard.Key | keyboard.KeyCode] = set()
-        self._current_keys: set[keyboard.Key | keyboard.KeyCode] = set()
-        self._listener: keyboard.Listener | None = None
-        self._listener_thread: Thread | None = None
+
+        # The hotkey is parsed once here and only again when its normalized form changes.
+        self._hotkey_str_norm = self._normalize_hotkey_string(config.ui.hotkey)
+        self._pynput_hotkey = self._parse_hotkey_string(self._hotkey_str_norm) if self._hotkey_str_norm else ""
+        self._listener: keyboard.GlobalHotKeys | None = None
 
     @staticmethod
-    def _parse_hotkey_string(hotkey_str: str) -> set[keyboard.Key | keyboard.KeyCode]:
+    def _normalize_hotkey_string(hotkey_str: str) -> str:
+        """Lowercases the hotkey and strips the whitespace around it and each of its parts."""
+
+        return "+".join(part.strip() for part in hotkey_str.strip().lower().split("+")) if hotkey_str.strip() else ""
+
+    @staticmethod
+    def _parse_hotkey_string(hotkey_str: str) -> str:
         """
-        Parses a user-friendly hotkey string (e.g., "ctrl+shift+f7") into a
-        set of pynput key objects. Returns an empty set if parsing fails.
+        Translates a hotkey string already passed through _normalize_hotkey_string
+        (e.g., "ctrl+shift+f7") into pynput's hotkey syntax (e.g., "<ctrl>+<shift>+<f7>").
+        Returns an empty string if parsing fails.
         """
 
-        target_keys: set[keyboard.Key | keyboard.KeyCode] = set()
-        log.info(f"Attempting to parse global hotkey: '{hotkey_str}'")
+        log.info("Attempting to parse global hotkey: '%s'", hotkey_str)
 
         if not hotkey_str:
             log.error("Hotkey string is empty. Hotkey will be disabled.")
-            return set()
+            return ""
 
-        key_parts = [part.strip().lower() for part in hotkey_str.split("+")]
-        for part in key_parts:
-            try:
-                # First, try to match special keys from the enum (e.g., 'f7', 'ctrl_l', 'shift')
-                key = keyboard.Key[part]
-            except KeyError:
-                # If that fails, assume it's a normal character (e.g., 'a', '7')
-                if len(part) == 1:
-                    key = keyboard.KeyCode.from_char(part)
-                else:
-                    log.error(
-                        f"Invalid key name '{part}' in hotkey. Please use names like 'f7', 'ctrl', 'shift', 'alt', or single characters. Hotkey will be disabled."
-                    )
-                    return set()
-            target_keys.add(key)
-
-        if not target_keys:
-            log.warning("No valid keys found after parsing. Hotkey will be disabled.")
-        else:
-            log.info(f"Successfully parsed hotkey. Target keys: {target_keys}")
-
-        return target_keys
-
-    def _on_press(self, key: keyboard.Key | keyboard.KeyCode):
-        """Callback for when pynput detects a key press."""
-
-        self._current_keys.add(key)
-        if self._current_keys == self._target_keys:
-            log.info("Global hotkey combination pressed!")
-            self.hotkey_triggered.emit()
-
-    def _on_release(self, key: keyboard.Key | keyboard.KeyCode):
-        """Callback for when pynput detects a key release."""
-
-        self._current_keys.discard(key)
+        # Translation is cached, so switching back to an earlier hotkey skips it.
+        pynput_hotkey = _to_pynput_hotkey(hotkey_str)
+        if pynput_hotkey is None:
+            log.error(
+                "Invalid key name in hotkey '%s'. Please use names like 'f7', 'ctrl', 'shift', 'alt', or single characters. Hotkey will be disabled.",
+                hotkey_str,
+            )
+            return ""
+
+        log.info("Successfully parsed hotkey: %s", pynput_hotkey)
+        return pynput_hotkey
+
+    def _on_activate(self):
+        """Callback for when pynput detects the full hotkey combination."""
+
+        log.info("Global hotkey combination pressed!")
+        self.hotkey_triggered.emit()
 
     def start_listener(self):
         """
@@ -88,20 +126,29 @@ class HotkeyManager(QObject):
         # Stop any existing listener first
         self.stop_listener()
 
-        hotkey_str = self._config.ui.hotkey
+        hotkey_str = self._hotkey_str_norm
         if not hotkey_str:
             log.info("No hotkey configured. Listener will not start.")
             return
 
-        self._target_keys = self._parse_hotkey_string(hotkey_str)
-        if not self._target_keys:
-            log.warning("Cannot start listener: hotkey parsed to empty set.")
+        if not self._pynput_hotkey:
+            log.warning("Cannot start listener: hotkey could not be parsed.")
             return
 
-        self._listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)  # pyright: ignore[reportArgumentType]
-        self._listener_thread = Thread(target=self._listener.run, name="hotkey-listener", daemon=True)
-        self._listener_thread.start()
-        log.info(f"Global hotkey listener started for: {hotkey_str}")
+        # GlobalHotKeys tracks the pressed keys itself, canonicalizes left/right
+        # modifiers, and only fires once per activation of the combination.
+        listener_kwargs = {}
+        if sys.platform == "win32":
+            # Drop unrelated keystrokes inside the hook, before pynput builds
+            # key objects and dispatches them to Python callbacks.
+            vk_codes = _win32_vk_codes(self._pynput_hotkey)
+            if vk_codes is not None:
+                listener_kwargs["win32_event_filter"] = lambda _msg, data: data.vkCode in vk_codes
+
+        self._listener = keyboard.GlobalHotKeys({self._pynput_hotkey: self._on_activate}, **listener_kwargs)
+        self._listener.name = "hotkey-listener"
+        self._listener.start()
+        log.info("Global hotkey listener started for: %s", hotkey_str)
 
     def stop_listener(self):
         """Stops the keyboard listener thread."""
@@ -110,20 +157,25 @@ class HotkeyManager(QObject):
             try:
                 self._listener.stop()
                 self._listener = None
-                self._listener_thread = None
                 log.info("Global hotkey listener stopped.")
             except Exception as e:
-                log.error(f"Error stopping listener: {e}")
+                log.error("Error stopping listener: %s", e)
 
     def on_config_changed(self, new_config: AppConfig):
         """
         Hot-reloads the hotkey by stopping the old listener and starting a new one.
         """
 
-        # Only restart if the hotkey string actually changed
-        if self._config.ui.hotkey != new_config.ui.hotkey:
-            log.info("Hotkey configuration changed. Reloading listener...")
-            self._config = new_config
-            self.start_listener()
-        else:
-            self._config = new_config
+        self._config = new_config
+
+        # Only re-parse and restart if the hotkey actually changed. This compares
+        # against the stored normalized string rather than the old config, since
+        # the config object is shared and has already been updated in place.
+        new_norm = self._normalize_hotkey_string(new_config.ui.hotkey)
+        if new_norm == self._hotkey_str_norm:
+            return
+
+        log.info("Hotkey configuration changed. Reloading listener...")
+        self._hotkey_str_norm = new_norm
+        self._pynput_hotkey = self._parse_hotkey_string(new_norm) if new_norm else ""
+        self.start_listener()
@@ -1,5 +1,6 @@
 # pyright: reportUnknownMemberType = false, reportUnknownArgumentType = false
 
+import functools
 from typing import override
 
 from PySide6.QtGui import QKeyEvent, Qt
@@ -12,6 +13,37 @@ class HotkeyRecorder(QLineEdit):
     It formats the keys into a string compatible with pynput (e.g., 'ctrl+shift+f7').
     """
 
+    # Order: Ctrl -> Shift -> Alt -> Meta -> Key
+    _MODIFIER_PARTS = (
+        (Qt.KeyboardModifier.ControlModifier, "CTRL"),
+        (Qt.KeyboardModifier.ShiftModifier, "SHIFT"),
+        (Qt.KeyboardModifier.AltModifier, "ALT"),
+        (Qt.KeyboardModifier.MetaModifier, "WIN"),
+    )
+
+    _KEY_MAP = {
+        Qt.Key.Key_Space: "SPACE",
+        Qt.Key.Key_Tab: "TAB",
+        Qt.Key.Key_Return: "ENTER",
+        Qt.Key.Key_Enter: "ENTER",
+        Qt.Key.Key_Insert: "INSERT",
+        Qt.Key.Key_Home: "HOME",
+        Qt.Key.Key_End: "END",
+        Qt.Key.Key_PageUp: "PAGE_UP",
+        Qt.Key.Key_PageDown: "PAGE_DOWN",
+        Qt.Key.Key_Minus: "-",
+        Qt.Key.Key_Equal: "=",
+        Qt.Key.Key_BracketLeft: "[",
+        Qt.Key.Key_BracketRight: "]",
+        Qt.Key.Key_Backslash: "\\",
+        Qt.Key.Key_Semicolon: ";",
+        Qt.Key.Key_Apostrophe: "'",
+        Qt.Key.Key_Comma: ",",
+        Qt.Key.Key_Period: ".",
+        Qt.Key.Key_Slash: "/",
+        Qt.Key.Key_QuoteLeft: "`",
+    }
+
     def __init__(self):
         super().__init__()
         self.setPlaceholderText("Click to record...")
@@ -48,17 +80,7 @@ class HotkeyRecorder(QLineEdit):
         if key in (Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Meta):
             return
 
-        parts = []
-
-        # Order: Ctrl -> Shift -> Alt -> Meta -> Key
-        if modifiers & Qt.KeyboardModifier.ControlModifier:
-            parts.append("CTRL")
-        if modifiers & Qt.KeyboardModifier.ShiftModifier:
-            parts.append("SHIFT")
-        if modifiers & Qt.KeyboardModifier.AltModifier:
-            parts.append("ALT")
-        if modifiers & Qt.KeyboardModifier.MetaModifier:
-            parts.append("WIN")
+        parts = [name for modifier, name in self._MODIFIER_PARTS if modifiers & modifier]
 
         # Map the primary key to a string
         key_text = self._map_qt_key_to_string(key)
@@ -71,8 +93,10 @@ class HotkeyRecorder(QLineEdit):
         self.setText(final_hotkey)
         self.clearFocus()
 
-    def _map_qt_key_to_string(self, qt_key: int) -> str | None:
-        """Maps Qt key codes to pynput-compatible string representations."""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _map_qt_key_to_string(qt_key: int) -> str | None:
+        """Maps Qt key codes to pynput-compatible string representations. Results are cached per key."""
 
         # Function Keys
         # F1 = 100, F5 = 104, let's assume wa want qt_key = F5
@@ -88,27 +112,4 @@ class HotkeyRecorder(QLineEdit):
             return chr(qt_key)
 
         # Common Special Keys
-        mapping = {
-            Qt.Key.Key_Space: "SPACE",
-            Qt.Key.Key_Tab: "TAB",
-            Qt.Key.Key_Return: "ENTER",
-            Qt.Key.Key_Enter: "ENTER",
-            Qt.Key.Key_Insert: "INSERT",
-            Qt.Key.Key_Home: "HOME",
-            Qt.Key.Key_End: "END",
-            Qt.Key.Key_PageUp: "PAGE_UP",
-            Qt.Key.Key_PageDown: "PAGE_DOWN",
-            Qt.Key.Key_Minus: "-",
-            Qt.Key.Key_Equal: "=",
-            Qt.Key.Key_BracketLeft: "[",
-            Qt.Key.Key_BracketRight: "]",
-            Qt.Key.Key_Backslash: "\\",
-            Qt.Key.Key_Semicolon: ";",
-            Qt.Key.Key_Apostrophe: "'",
-            Qt.Key.Key_Comma: ",",
-            Qt.Key.Key_Period: ".",
-            Qt.Key.Key_Slash: "/",
-            Qt.Key.Key_QuoteLeft: "`",
-        }
-
-        return mapping.get(qt_key, None)  # pyright: ignore[reportCallIssue, reportUnknownVariableType, reportArgumentType]
+        return HotkeyRecorder._KEY_MAP.get(qt_key)  # pyright: ignore[reportCallIssue, reportUnknownVariableType, reportArgumentType]
@@ -1,12 +1,10 @@
 # pyright: reportGeneralTypeIssues=false, reportUnknownMemberType=false
 
 import logging
-import os
 import socket
-from threading import Thread
 from typing import final
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QSocketNotifier, Signal
 
 
 log = logging.getLogger(__name__)
@@ -15,77 +13,79 @@ log = logging.getLogger(__name__)
 @final
 class IpcListener(QObject):
     """
-    Listens on a UNIX socket for connections to trigger actions.
+    Listens on an abstract-namespace UNIX datagram socket for messages to
+    trigger actions.
     This serves as the "hotkey" mechanism for Linux/Wayland environments
     where global keyboard hooks are unreliable or discouraged.
+
+    The socket is watched by a QSocketNotifier, so messages are handled
+    directly on the Qt event loop without a dedicated thread. Any datagram,
+    even an empty one, counts as a toggle request.
+
+    Abstract sockets never touch the filesystem, so there is no socket file
+    to clean up after a crash and nothing to race on at startup.
     """
 
     toggle_visibility_requested = Signal()
 
-    def __init__(self, socket_path: str):
+    def __init__(self, socket_name: str):
         super().__init__()
-        self.socket_path = socket_path
-        self._running = False
-        self._thread = Thread(target=self._run, daemon=True)
-
-        # Clean up any stale socket file from a previous crash
-        if os.path.exists(self.socket_path):
-            try:
-                os.remove(self.socket_path)
-            except OSError as e:
-                log.error(f"Failed to remove stale IPC socket file: {e}")
+        self.socket_name = socket_name
+        self._address = f"\0{socket_name}"
+        self._server: socket.socket | None = None
+        self._notifier: QSocketNotifier | None = None
 
     def start(self):
-        """Starts the listener thread."""
+        """Binds the socket and starts watching it for messages."""
 
-        if not self._running:
-            self._running = True
-            self._thread.start()
-            log.info("IpcListener has been started.")
+        if self._server:
+            return
 
-    def stop(self):
-        """Stops the listener thread gracefully."""
-
-        if self._running:
-            self._running = False
-            # Briefly connect to the socket to unblock the `server.accept()`
-            # call, allowing the loop to terminate.
-            try:
-                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                    s.settimeout(0.1)
-                    s.connect(self.socket_path)
-            except (FileNotFoundError, ConnectionRefusedError, socket.timeout):
-                # This is expected if the socket is already closing.
-                pass
-            self._thread.join(timeout=2.0)
-            log.info("IPC listener stopped.")
-
-    def _run(self):
-        log.info(f"IPC listener starting at {self.socket_path}")
-        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        log.info("IPC listener starting at abstract socket '@%s'", self.socket_name)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
         try:
-            server.bind(self.socket_path)
-            server.listen(1)
-            # Use a timeout to periodically check if the thread should stop
-            server.settimeout(1.0)
-
-            while self._running:
-                try:
-                    connection, _ = server.accept()  # pyright: ignore[reportAny]
-                    connection.close()
-
-                    # Check self._running again in case stop() was called during accept()
-                    if self._running:
-                        log.info("IPC signal received, requesting visibility toggle.")
-                        self.toggle_visibility_requested.emit()
-                except socket.timeout:
-                    # This is normal, just lets us check the while condition
-                    continue
-                except Exception as e:
-                    if self._running:
-                        log.error(f"Error in IPC listener: {e}")
-        finally:
+            server.bind(self._address)
+            server.setblocking(False)
+        except OSError as e:
+            log.error("Failed to start IPC listener: %s", e)
             server.close()
-            if os.path.exists(self.socket_path):
-                os.remove(self.socket_path)
-            log.info("IPC listener has shut down.")
+            return
+
+        self._server = server
+        self._notifier = QSocketNotifier(server.fileno(), QSocketNotifier.Type.Read, self)
+        _ = self._notifier.activated.connect(self._on_message_ready)
+        log.info("IpcListener has been started.")
+
+    def stop(self):
+        """Stops watching the socket and closes it."""
+
+        if not self._server:
+            return
+
+        if self._notifier:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+
+        self._server.close()
+        self._server = None
+        log.info("IPC listener stopped.")
+
+    def _on_message_ready(self):
+        """Reads a pending datagram and requests a visibility toggle."""
+
+        if not self._server:
+            return
+
+        try:
+            # The payload is irrelevant, receiving the datagram is the message.
+            _ = self._server.recv(16)
+        except BlockingIOError:
+            # Another activation already drained the pending message.
+            return
+        except OSError as e:
+            log.error("Error in IPC listener: %s", e)
+            return
+
+        log.info("IPC signal received, requesting visibility toggle.")
+        self.toggle_visibility_requested.emit()
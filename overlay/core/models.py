@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class SpotifyConfig:
     client_id: str
     redirect_uri: str
     poll_interval_ms: int
+    max_poll_interval_ms: int
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     position: str  # top-left, top-right, bottom-left, bottom-right
     margin: int
@@ -14,15 +15,17 @@ class UIConfig:
     art_size: int
     hotkey: str
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     client: SpotifyConfig
     ui: UIConfig
     app_directory: str
     data_directory: str
     config_path: str
+    tray_icon_path: str
+    icon_exists: bool = False
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NowPlaying:
     title: str
     artist: str
@@ -1,24 +1,175 @@
 # pyright: reportAny=false, reportMissingTypeStubs=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 
+import functools
+import hashlib
 import logging
 import os
+import queue
+import random
 import threading
-import time
-from typing import final
+from typing import final, override
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal, SignalInstance
+import requests
+from requests.adapters import HTTPAdapter
 import spotipy
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyPKCE
 
+from overlay.core.config import APP_NAME, APP_VERSION
 from overlay.core.models import AppConfig, NowPlaying
 
 
 SPOTIFY_SCOPE = "user-read-playback-state user-read-currently-playing"
 SPOTIFY_CACHE_FILENAME = "spotify_token_cache"
+SPOTIFY_PLAYBACK_ENDPOINT = "me/player/currently-playing"
+# Polled this long after a track's expected end, to catch the next one.
+TRACK_END_GRACE_SECONDS = 0.5
+# Spotify briefly reports nothing playing while switching to a manually picked
+# track, so a stop is only shown once a poll this much later confirms it.
+STOPPED_CONFIRM_DELAY_MS = 150
+# Retries use capped exponential backoff with full jitter unless Spotify
+# sends a Retry-After header.
+FETCH_MAX_ATTEMPTS = 4
+FETCH_BACKOFF_BASE_SECONDS = 0.5
+FETCH_BACKOFF_CAP_SECONDS = 16.0
+# Longer Retry-After values are left to the rate-limit factor on the poll
+# interval, so a single retry never holds the only in-flight poll for hours.
+RETRY_AFTER_MAX_SECONDS = FETCH_BACKOFF_CAP_SECONDS * 4
+# Poll intervals are multiplied by up to this much while rate limited.
+RATE_LIMIT_MAX_FACTOR = 16
+# The poller only ever has one request in flight; a couple of spare slots cover
+# overlapping calls such as the initial fetch.
+HTTP_POOL_CONNECTIONS = 2
+HTTP_POOL_MAXSIZE = 4
+# How long close() lets an in-flight fetch finish before abandoning its thread.
+FETCH_SHUTDOWN_TIMEOUT_SECONDS = 2.0
 
 log = logging.getLogger(__name__)
 
 
+has_orjson = False
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    has_orjson = True
+except ImportError:
+    log.debug("orjson not found. Playback responses will be decoded with the stdlib json module.")
+
+
+@final
+class MemoryBackedCacheHandler(CacheFileHandler):
+    """
+    A token cache that reads the cache file once and then serves the token
+    from memory. spotipy asks for the token before every request, and
+    refreshed tokens are still written through to the file.
+    """
+
+    def __init__(self, cache_path: str):
+        super().__init__(cache_path=cache_path)
+        self._token: dict[str, object] | None = None
+        self._loaded = False
+
+    @override
+    def get_cached_token(self):  # pyright: ignore[reportIncompatibleMethodOverride]
+        if not self._loaded:
+            self._token = super().get_cached_token()
+            self._loaded = True
+
+        return self._token
+
+    @override
+    def save_token_to_cache(self, token_info):  # pyright: ignore[reportIncompatibleMethodOverride, reportMissingParameterType]
+        self._token = token_info
+        self._loaded = True
+        super().save_token_to_cache(token_info)
+
+    def clear(self):
+        """Forgets the token and removes the cache file."""
+
+        self._token = None
+        self._loaded = True
+        try:
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=4)
+def _make_auth_manager(client_id: str, redirect_uri: str, scope: str, cache_path: str) -> SpotifyPKCE:
+    """Creates one PKCE auth manager per credential set so its in-memory token is reused."""
+
+    return SpotifyPKCE(
+        client_id=client_id,
+        redirect_uri=redirect_uri,
+        scope=scope,
+        cache_handler=MemoryBackedCacheHandler(cache_path),
+        open_browser=True,
+    )
+
+
+@final
+class PlaybackSession(requests.Session):
+    """
+    A requests session for the playback endpoint that sends conditional
+    requests when Spotify provides an ETag, and skips JSON decoding of
+    responses whose body is identical to the previous one, which is the
+    common case while playback is paused.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.headers["User-Agent"] = f"{APP_NAME}/{APP_VERSION}"
+
+        # Retries are handled by SpotifyClient.get_current, not by urllib3.
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+        self.mount("https://", adapter)
+
+        self._etag: str | None = None
+        self._last_response: requests.Response | None = None
+        self._last_digest: bytes | None = None
+        self._last_json: object = None
+
+    @override
+    def request(self, method, url, *args, **kwargs):  # pyright: ignore[reportIncompatibleMethodOverride, reportMissingParameterType]
+        is_playback = method == "GET" and SPOTIFY_PLAYBACK_ENDPOINT in url
+        if is_playback and self._etag and self._last_response is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "If-None-Match": self._etag}
+
+        response = super().request(method, url, *args, **kwargs)
+        if not is_playback:
+            return response
+
+        # Spotipy reads a 304 as an empty body, so hand it the previous response instead.
+        if response.status_code == 304 and self._last_response is not None:
+            cached = self._last_json
+            self._last_response.json = lambda **_kwargs: cached
+            return self._last_response
+
+        self._etag = response.headers.get("ETag")
+        self._last_response = None
+        if not response.content:
+            return response
+
+        self._last_response = response
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        if digest == self._last_digest:
+            cached = self._last_json
+            response.json = lambda **_kwargs: cached
+            return response
+
+        decode = response.json
+
+        def json(**kwargs):
+            result = orjson.loads(response.content) if has_orjson and not kwargs else decode(**kwargs)
+            self._last_digest = digest
+            self._last_json = result
+            return result
+
+        response.json = json
+        return response
+
+
 @final
 class SpotifyClient(QObject):
     """
@@ -30,14 +181,46 @@ class SpotifyClient(QObject):
     clear_ui_requested = Signal()
     setup_required = Signal() 
 
+    # Hand fetched states from the fetch thread back to the main thread.
+    _state_fetched = Signal(object)
+    _initial_state_fetched = Signal(object)
+
     def __init__(self, config: AppConfig):
         super().__init__()
         self._config = config
         self._sp: spotipy.Spotify | None = None
-        self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
+        self._polling = False
+        self._poll_in_flight = False
+        # One long-lived daemon worker runs every fetch. It is fed through a
+        # queue, and holds the lock while a request is running.
+        self._fetch_queue: queue.SimpleQueue[SignalInstance | None] = queue.SimpleQueue()
+        self._fetch_lock = threading.Lock()
+        self._fetch_thread: threading.Thread | None = None
+        self._confirming_stop = False
         self._last_state: NowPlaying | None = None
+
+        # The raw fields that identify the last parsed response, so an unchanged
+        # response (e.g. while paused) hands back the same NowPlaying object.
+        self._last_fetch_key: tuple[str | None, bool, int] | None = None
+        self._last_fetched: NowPlaying | None = None
         self._poll_interval = max(0.25, config.client.poll_interval_ms / 1000.0)
+        self._max_poll_interval = max(self._poll_interval, config.client.max_poll_interval_ms / 1000.0)
+        self._sleep_duration = self._poll_interval
+        # Doubled on every 429 and reset by the next successful request.
+        self._rate_limit_factor = 1
+
+        # Polls are scheduled on the main thread and only the blocking request
+        # runs on the fetch worker, which just blocks on its queue between polls.
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        _ = self._poll_timer.timeout.connect(self._poll_once)
+        _ = self._state_fetched.connect(self._on_state_fetched)
+        _ = self._initial_state_fetched.connect(self._on_initial_state_fetched)
+
+        # A single session is shared by every request so the keep-alive
+        # connection to the Web API is reused across polls.
+        self._session = PlaybackSession()
 
         self.cache_path = os.path.join(config.data_directory, SPOTIFY_CACHE_FILENAME)
         os.makedirs(config.data_directory, exist_ok=True)
@@ -63,86 +246,207 @@ class SpotifyClient(QObject):
         """Initializes the Spotipy client with the current config."""
 
         try:
-            auth_manager = SpotifyPKCE(
-                client_id=self._config.client.client_id,
-                redirect_uri=self._config.client.redirect_uri,
-                scope=SPOTIFY_SCOPE,
-                cache_path=self.cache_path,
-                open_browser=True,
+            auth_manager = _make_auth_manager(
+                self._config.client.client_id,
+                self._config.client.redirect_uri,
+                SPOTIFY_SCOPE,
+                self.cache_path,
             )
-            self._sp = spotipy.Spotify(auth_manager=auth_manager)
+            if self._sp is not None and self._sp.auth_manager is auth_manager:
+                log.debug("Spotify credentials unchanged, keeping the existing client.")
+                return
+
+            self._sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=self._session, retries=0)
             log.info("Spotify client initialized successfully.")
         except Exception as e:
-            log.error(f"Failed to initialize Spotify client: {e}")
+            log.error("Failed to initialize Spotify client: %s", e)
 
     def get_current(self) -> NowPlaying | None:
         """
-        Fetches the currently playing track from Spotify, with one retry on failure.
+        Fetches the currently playing track from Spotify, making up to
+        FETCH_MAX_ATTEMPTS attempts with Retry-After or jittered backoff between them.
         Returns a NowPlaying object or None if no track is playing.
         """
 
         if not self._sp:
             return None
 
-        for attempt in range(2):
+        for attempt in range(FETCH_MAX_ATTEMPTS):
             try:
                 data = self._sp.current_user_playing_track()
+                self._rate_limit_factor = 1
                 if data and data.get("item"):
                     item = data["item"]
+                    is_playing = data.get("is_playing", False)
+                    progress_ms = data.get("progress_ms", 0)
+                    fetch_key = (item.get("id"), is_playing, progress_ms)
+                    if fetch_key == self._last_fetch_key:
+                        return self._last_fetched
+
                     album = item.get("album", {})
                     images = album.get("images", [])
 
-                    return NowPlaying(
+                    # Most tracks have exactly one artist, which needs no join.
+                    artists = item.get("artists") or ()
+                    if len(artists) == 1 and artists[0] and artists[0].get("name"):
+                        artist = artists[0]["name"]
+                    else:
+                        artist = ", ".join([a["name"] for a in artists if a and a.get("name")])
+
+                    self._last_fetch_key = fetch_key
+                    self._last_fetched = NowPlaying(
                         title=item.get("name", ""),
-                        artist=", ".join(a["name"] for a in item.get("artists", []) if a and a.get("name")),
+                        artist=artist,
                         album=album.get("name", ""),
                         album_art_url=images[0]["url"] if images else None,
-                        is_playing=data.get("is_playing", False),
-                        progress_ms=data.get("progress_ms", 0),
+                        is_playing=is_playing,
+                        progress_ms=progress_ms,
                         duration_ms=item.get("duration_ms", 0),
                     )
+                    return self._last_fetched
                 return None
             except spotipy.SpotifyException as e:
-                log.warning(f"Spotify API error on attempt {attempt + 1}: {e}")
-                time.sleep(1)
+                log.warning("Spotify API error on attempt %s: %s", attempt + 1, e)
+                if e.http_status == 429:
+                    self._rate_limit_factor = min(RATE_LIMIT_MAX_FACTOR, self._rate_limit_factor * 2)
+                error: Exception = e
             except Exception as e:
-                log.error(f"Unexpected error fetching track on attempt {attempt + 1}: {e}")
+                log.error("Unexpected error fetching track on attempt %s: %s", attempt + 1, e)
+                error = e
+
+            if attempt + 1 == FETCH_MAX_ATTEMPTS:
+                break
+
+            # Interruptible, so stop() doesn't have to wait out the retry delay.
+            if self._stop_event.wait(self._retry_delay(error, attempt)):
+                break
 
         return None
 
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Returns how long to wait before retrying a failed request."""
+
+        headers = error.headers if isinstance(error, spotipy.SpotifyException) else None
+        retry_after = (headers or {}).get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), RETRY_AFTER_MAX_SECONDS)
+            except ValueError:
+                pass
+
+        return random.uniform(0, min(FETCH_BACKOFF_CAP_SECONDS, FETCH_BACKOFF_BASE_SECONDS * 2**attempt))
+
     def start_polling(self) -> None:
         if not self._sp:
             log.warning("Cannot start polling: Spotify client not initialized.")
             return
 
-        if self._thread and self._thread.is_alive():
+        if self._polling:
             return
 
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run_polling_loop, name="spotify-poller", daemon=True)
-        self._thread.start()
-
-    def _run_polling_loop(self):
-        idle_backoff_seconds = 2.0
-        while not self._stop_event.is_set():
-            # Double check if the client has been initialized. Just to be sure
-            if not self._sp: 
-                break
+        self._polling = True
+        self._confirming_stop = False
+        self._sleep_duration = self._poll_interval
+        self._poll_timer.start(0)
+
+    def _poll_once(self):
+        # Double check if the client has been initialized. Just to be sure
+        if not self._sp or not self._polling:
+            return
+
+        # A poll still running from before a restart will reschedule itself.
+        if self._poll_in_flight:
+            return
+
+        self._poll_in_flight = True
+        self._start_fetch(self._state_fetched)
+
+    def _start_fetch(self, done: SignalInstance):
+        """
+        Queues a get_current call on the fetch worker, which emits the result
+        through `done`. A fetch can block indefinitely in the first-run browser
+        authorization, which nothing can interrupt, so the worker is a daemon
+        thread that shutdown can abandon, unlike a QThreadPool worker.
+        """
 
-            current_state = self.get_current()
-            if current_state != self._last_state:
-                self.now_playing_updated.emit(current_state)
-                self._last_state = current_state
+        if self._fetch_thread is None:
+            self._fetch_thread = threading.Thread(target=self._fetch_loop, name="spotify-fetch", daemon=True)
+            self._fetch_thread.start()
+        self._fetch_queue.put(done)
 
-            sleep_duration = idle_backoff_seconds if (current_state is None or not current_state.is_playing) else self._poll_interval
-            time.sleep(sleep_duration)
+    def _fetch_loop(self):
+        while (done := self._fetch_queue.get()) is not None:
+            with self._fetch_lock:
+                state = self.get_current()
+            done.emit(state)
+
+    def _on_state_fetched(self, current_state: NowPlaying | None):
+        self._poll_in_flight = False
+        if not self._polling:
+            return
+
+        if current_state is None and self._last_state is not None and not self._confirming_stop:
+            self._confirming_stop = True
+            self._poll_timer.start(STOPPED_CONFIRM_DELAY_MS)
+            return
+        self._confirming_stop = False
+
+        # The identity check short-circuits the field-by-field comparison
+        # whenever get_current handed back the cached object.
+        changed = current_state is not self._last_state and current_state != self._last_state
+        if changed:
+            self.now_playing_updated.emit(current_state)
+            self._last_state = current_state
+
+        if current_state and current_state.is_playing and current_state.duration_ms > 0:
+            # The overlay extrapolates progress locally, so while a track plays
+            # the next interesting moment is its end.
+            remaining = (current_state.duration_ms - current_state.progress_ms) / 1000.0 + TRACK_END_GRACE_SECONDS
+            self._sleep_duration = max(self._poll_interval, min(remaining, self._max_poll_interval))
+        elif changed:
+            self._sleep_duration = self._poll_interval
+        else:
+            # Nothing changed (e.g. paused or stopped), so back off exponentially up to the cap.
+            self._sleep_duration = min(self._max_poll_interval, self._sleep_duration * 2)
+
+        # Back off further while Spotify keeps rate limiting us. Applied to this
+        # delay only, so the paused backoff doesn't keep doubling from it.
+        delay = self._sleep_duration * self._rate_limit_factor
+
+        self._poll_timer.start(int(delay * 1000))
+
+    def reset_poll_interval(self) -> None:
+        """
+        Polls right away and drops back to the base interval. Called on user
+        interaction so a backed-off poller picks up changes right away.
+        """
+
+        self._sleep_duration = self._poll_interval
+        if self._poll_timer.isActive():
+            self._poll_timer.start(0)
 
     def stop(self) -> None:
-        """Stops the background polling thread."""
+        """Stops scheduling polls and interrupts a pending retry."""
 
+        self._polling = False
         self._stop_event.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2.0)
+        self._poll_timer.stop()
+
+    def close(self) -> None:
+        """Stops polling and releases the pooled HTTP connections."""
+
+        self.stop()
+
+        if self._fetch_thread is not None:
+            # Lets the worker exit once it is idle.
+            self._fetch_queue.put(None)
+            if self._fetch_lock.acquire(timeout=FETCH_SHUTDOWN_TIMEOUT_SECONDS):
+                self._fetch_lock.release()
+            else:
+                log.warning("A Spotify request is still running (e.g. waiting for authorization); not waiting for it.")
+        self._session.close()
 
     def relogin(self) -> None:
         """
@@ -158,31 +462,39 @@ class SpotifyClient(QObject):
         self.clear_ui_requested.emit()
         self._last_state = None
 
-        if os.path.exists(self.cache_path):
-            try:
-                os.remove(self.cache_path)
-            except OSError:
-                pass
+        self._sp.auth_manager.cache_handler.clear()
 
         log.info("Restarting polling to trigger re-authentication.")
         self.start_polling()
 
     def initial_fetch_and_emit(self) -> None:
         """
-        Performs a single, blocking fetch for the current track and emits it.
-        This is intended for setting the initial state at application startup.
+        Fetches the current track on a background thread and emits it, even if
+        nothing is playing. This is intended for setting the initial state at
+        application startup, without blocking it on the network or on the
+        first-run authentication flow.
         """
 
         if not self._sp: return
 
         log.info("Performing initial fetch...")
-        initial_state = self.get_current()
+        # Polls started meanwhile wait for this fetch, which schedules the next one.
+        self._poll_in_flight = True
+        self._start_fetch(self._initial_state_fetched)
+
+    def _on_initial_state_fetched(self, initial_state: NowPlaying | None):
+        self._poll_in_flight = False
         self.now_playing_updated.emit(initial_state)
         self._last_state = initial_state
 
+        if self._polling:
+            self._poll_timer.start(int(self._sleep_duration * 1000))
+
     def on_config_changed(self, new_config: AppConfig):
         """Updates the client's settings when the application config changes."""
 
-        log.info(f"Configuration changed. Updating poll interval to {new_config.client.poll_interval_ms}ms.")
+        log.info("Configuration changed. Updating poll interval to %sms.", new_config.client.poll_interval_ms)
         self._config = new_config
         self._poll_interval = max(0.25, new_config.client.poll_interval_ms / 1000.0)
+        self._max_poll_interval = max(self._poll_interval, new_config.client.max_poll_interval_ms / 1000.0)
+        self.reset_poll_interval()
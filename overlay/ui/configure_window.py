@@ -1,3 +1,4 @@
+from dataclasses import replace
 import logging
 from typing import final, override
 
@@ -183,7 +184,8 @@ class ConfigureWindow(QWidget):
         signal to notify the rest of the application, and closes the window.
         """
 
-        log.info("Saving new configuration.")
+        # Snapshot the sections so an unchanged save doesn't notify anyone.
+        previous = (replace(self._shared_config.client), replace(self._shared_config.ui))
 
         # Modify the shared config object directly.
         self._shared_config.client.client_id = self.client_id_input.text()
@@ -195,6 +197,13 @@ class ConfigureWindow(QWidget):
         self._shared_config.client.poll_interval_ms = self.poll_interval_spinbox.value()
         self._shared_config.ui.hotkey = self.hotkey_input.text()
 
+        if (self._shared_config.client, self._shared_config.ui) == previous:
+            log.info("No settings changed, nothing to save.")
+            _ = self.close()
+            return
+
+        log.info("Saving new configuration.")
+
         # Emit the signal containing the reference to the now-modified shared object.
         self.config_saved.emit(self._shared_config)
         _ = self.close()
@@ -1,16 +1,21 @@
 # pyright: reportAttributeAccessIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownParameterType=false, reportAny=false, reportPossiblyUnboundVariable=false, reportUnannotatedClassAttribute=false, reportUnknownArgumentType=false, reportOptionalMemberAccess=false
 
+from collections import OrderedDict
+import functools
+import hashlib
 import io
 import logging
 import os
 import sys
 from typing import override
-import urllib.request
 
 from PIL import Image
-from PySide6.QtCore import QThread, QTimer, Qt, Signal, Slot
-from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPixmap
-from PySide6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QVBoxLayout, QWidget
+from PySide6.QtCore import Property, QElapsedTimer, QMutex, QMutexLocker, QObject, QRect, QStandardPaths, QThread, QTimer, Qt, Signal, Slot
+from PySide6.QtGui import QColor, QGuiApplication, QImage, QPainter, QPainterPath, QPixmap, QScreen
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from overlay.core.models import AppConfig, NowPlaying
 
@@ -20,27 +25,44 @@ WINDOW_HEIGHT = 82
 TITLE_MAX_LEN = 30
 ARTIST_MAX_LEN = 40
 PROGRESS_BAR_HEIGHT = 5
+PROGRESS_TICK_MS = 500
+NOW_PLAYING_COALESCE_MS = 50
 ART_IMAGE_CORNER_RADIUS = 6
+PROGRESS_BAR_CORNER_RADIUS = 2
 USER_AGENT = "Spoverlay/1.0"
+ART_CACHE_SIZE = 16
+ART_REQUEST_TIMEOUT_SECONDS = 10
+ART_DISK_CACHE_DIR_NAME = "art"
+ART_DISK_CACHE_MAX_FILES = 200
+# How long shutdown waits for an in-flight art download before abandoning it.
+ART_LOADER_SHUTDOWN_TIMEOUT_MS = 2000
 
 log = logging.getLogger(__name__)
 
+# Art threads abandoned at shutdown. Qt aborts the process if a running QThread
+# is destroyed, so they must not go down with the window that owned them.
+_abandoned_threads: list[QThread] = []
+
+
+@functools.cache
+def _win32_modules():
+    """Imports pywin32 on first use, so startup doesn't pay for it while click-through is off."""
 
-has_win32 = False
-if sys.platform == "win32":
     try:
         import win32gui, win32con  # pyright: ignore[reportMissingModuleSource]
-
-        has_win32 = True
     except ImportError:
         log.warning("pywin32 not found. Windows click-through will not work.")
+        return None
+    return win32gui, win32con
 
 
 def _set_window_clickthrough_windows(qt_window: QWidget, enabled: bool):
     """Configures (or removes) click-through on Windows using pywin32."""
 
-    if not has_win32 or not qt_window.winId():
+    modules = _win32_modules()
+    if modules is None or not qt_window.winId():
         return
+    win32gui, win32con = modules
     try:
         hwnd = int(qt_window.winId())
         style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
@@ -59,58 +81,237 @@ def _set_window_clickthrough_windows(qt_window: QWidget, enabled: bool):
         log.error(f"Failed to set Windows click-through properties: {e}")
 
 
+@functools.lru_cache(maxsize=256)
 def _truncate_text(text: str, max_length: int) -> str:
     """Truncates text with an ellipsis if it exceeds the max length."""
     return text[:max_length].rstrip() + "…" if len(text) > max_length else text
 
 
-class ArtLoader(QThread):
-    """A background thread to download and process album art without freezing the UI."""
+@functools.cache
+def _art_session() -> requests.Session:
+    """Returns the session shared by all art loaders, so the CDN connection stays warm."""
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+
+    # A flaky network gets one quick retry instead of hanging the loader.
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=Retry(total=1, backoff_factor=0.3))
+    session.mount("https://", adapter)
+
+    return session
 
-    art_loaded = Signal(QPixmap)
 
-    def __init__(self, url: str, size: int):
+class ArtLoader(QObject):
+    """
+    Downloads and processes album art on a single long-lived worker thread
+    without freezing the UI. It hands over a QImage; QPixmaps may only be
+    created on the GUI thread. Requests superseded by a newer one are dropped.
+    """
+
+    art_loaded = Signal(str, int, QImage)
+    _load_requested = Signal(str, int)
+
+    def __init__(self, cache_dir: str):
         super().__init__()
-        self._url, self._size = url, size
+        self._cache_dir = cache_dir
+
+        # The latest requested (url, size), written by the GUI thread.
+        self._latest_mutex = QMutex()
+        self._latest: tuple[str, int] | None = None
+
+        # Emitted from the GUI thread, so delivery to the worker thread is queued.
+        _ = self._load_requested.connect(self._load)
+
+    def request(self, url: str, size: int):
+        """Queues a load of the given cover, superseding any earlier request."""
+
+        with QMutexLocker(self._latest_mutex):
+            self._latest = (url, size)
+        self._load_requested.emit(url, size)
+
+    def _is_latest(self, url: str, size: int) -> bool:
+        with QMutexLocker(self._latest_mutex):
+            return self._latest == (url, size)
+
+    @Slot(str, int)
+    def _load(self, url: str, size: int):
+        if not self._is_latest(url, size):
+            return
+
+        # Resized covers are kept on disk per size, named after the URL's hash.
+        cache_dir = os.path.join(self._cache_dir, str(size))
+        cache_path = os.path.join(cache_dir, f"{hashlib.sha1(url.encode()).hexdigest()}.png")
+
+        cached = QImage(cache_path)
+        if not cached.isNull():
+            self.art_loaded.emit(url, size, cached)
+            # Touch the file so eviction drops the least recently shown covers.
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return
 
-    @override
-    def run(self):
         try:
-            req = urllib.request.Request(self._url, headers={"User-Agent": USER_AGENT})
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                image_data = resp.read()
-            with Image.open(io.BytesIO(image_data)) as img:
-                img = img.convert("RGBA")
-                if self._size > 0:
-                    img = img.resize((self._size, self._size), Image.Resampling.LANCZOS)
-                q_image = QImage(img.tobytes(), img.width, img.height, QImage.Format.Format_RGBA8888)
-                self.art_loaded.emit(QPixmap.fromImage(q_image))
+            resp = _art_session().get(url, timeout=ART_REQUEST_TIMEOUT_SECONDS)
+            resp.raise_for_status()
+            image_data = resp.content
+
+            # Qt decodes JPEG/PNG natively; PIL only handles what Qt can't read.
+            q_image = QImage()
+            if q_image.loadFromData(image_data):
+                # The painter blends this format without converting it first.
+                q_image = q_image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+                if size > 0:
+                    q_image = q_image.scaled(size, size, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            else:
+                q_image = self._decode_with_pil(image_data, size)
+            if self._is_latest(url, size):
+                self.art_loaded.emit(url, size, q_image)
+            self._store_in_cache(q_image, cache_dir, cache_path)
         except Exception as e:
-            log.error(f"Failed to load album art from {self._url}: {e}")
+            log.error(f"Failed to load album art from {url}: {e}")
+
+    @staticmethod
+    def _decode_with_pil(image_data: bytes, size: int) -> QImage:
+        """Decodes and resizes the image with PIL, for formats Qt has no plugin for."""
+
+        with Image.open(io.BytesIO(image_data)) as img:
+            if size > 0:
+                # Let the JPEG decoder downscale by a power of two while decoding,
+                # then box-reduce by whole factors so Lanczos only runs on the last step.
+                _ = img.draft("RGB", (size, size))
+                factor = min(img.width, img.height) // size
+                if factor >= 2:
+                    img = img.reduce(factor)
+            img = img.convert("RGBA")
+            if size > 0:
+                img = img.resize((size, size), Image.Resampling.LANCZOS)
+            # Copied so the image owns its pixels once PIL's buffer is gone.
+            return QImage(img.tobytes(), img.width, img.height, QImage.Format.Format_RGBA8888).copy()
+
+    @staticmethod
+    def _store_in_cache(image: QImage, cache_dir: str, cache_path: str):
+        """Atomically writes the resized cover to the disk cache and evicts the oldest ones."""
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            if not image.save(tmp_path, "PNG"):
+                return
+            os.replace(tmp_path, cache_path)
+
+            entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".png")]
+            if len(entries) > ART_DISK_CACHE_MAX_FILES:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[: len(entries) - ART_DISK_CACHE_MAX_FILES]:
+                    os.remove(entry.path)
+        except OSError as e:
+            log.warning(f"Failed to cache album art: {e}")
 
 
 class ArtLabel(QLabel):
-    """A custom QLabel that paints its pixmap with rounded corners."""
+    """
+    A custom QLabel that paints its pixmap with rounded corners. The rounded
+    version is rendered once per pixmap and size, so repaints are a plain blit.
+    """
 
     def __init__(self, *args, **kwargs):  # pyright: ignore[reportMissingParameterType]
         super().__init__(*args, **kwargs)
         self._pixmap: QPixmap | None = None
+        self._rounded: QPixmap | None = None
         self.radius = ART_IMAGE_CORNER_RADIUS
 
     @override
     def setPixmap(self, pixmap: QPixmap | None):  # pyright: ignore[reportIncompatibleMethodOverride]
+        if pixmap is not None:
+            pixmap.setDevicePixelRatio(self.devicePixelRatioF())
         self._pixmap = pixmap
+        self._rounded = None
         self.update()
 
+    @override
+    def resizeEvent(self, event):  # pyright: ignore[reportMissingParameterType, reportIncompatibleMethodOverride]
+        self._rounded = None
+        super().resizeEvent(event)
+
+    def _render_rounded(self) -> QPixmap:
+        """Renders the pixmap clipped to a rounded rect at the label's size."""
+
+        ratio = self.devicePixelRatioF()
+        rounded = QPixmap(self.size() * ratio)
+        rounded.setDevicePixelRatio(ratio)
+        rounded.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(self.rect(), self.radius, self.radius)
+        painter.setClipPath(path)
+        painter.drawPixmap(self.rect(), self._pixmap)
+        _ = painter.end()
+
+        return rounded
+
     @override
     def paintEvent(self, event):  # pyright: ignore[reportMissingParameterType, reportIncompatibleMethodOverride]
         if self._pixmap:
+            if self._rounded is None:
+                self._rounded = self._render_rounded()
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            path = QPainterPath()
-            path.addRoundedRect(self.rect(), self.radius, self.radius)
-            painter.setClipPath(path)
-            painter.drawPixmap(self.rect(), self._pixmap)
+            painter.drawPixmap(0, 0, self._rounded)
+
+
+class ProgressLine(QWidget):
+    """
+    A thin progress bar painted as two rounded rects, without going through
+    QProgressBar's style machinery. Colors come from the stylesheet via
+    qproperty-trackColor and qproperty-chunkColor.
+    """
+
+    def __init__(self, *args, **kwargs):  # pyright: ignore[reportMissingParameterType]
+        super().__init__(*args, **kwargs)
+        self._value = 0
+        self._track_color = QColor(255, 255, 255, 51)
+        self._chunk_color = QColor(255, 255, 255)
+
+    def setValue(self, value: int):
+        """Sets the progress in percent (0-100)."""
+
+        if value != self._value:
+            self._value = value
+            self.update()
+
+    def _get_track_color(self) -> QColor:
+        return self._track_color
+
+    def _set_track_color(self, color: QColor):
+        self._track_color = QColor(color)
+        self.update()
+
+    def _get_chunk_color(self) -> QColor:
+        return self._chunk_color
+
+    def _set_chunk_color(self, color: QColor):
+        self._chunk_color = QColor(color)
+        self.update()
+
+    trackColor = Property(QColor, _get_track_color, _set_track_color)
+    chunkColor = Property(QColor, _get_chunk_color, _set_chunk_color)
+
+    @override
+    def paintEvent(self, event):  # pyright: ignore[reportMissingParameterType, reportIncompatibleMethodOverride]
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        painter.setBrush(self._track_color)
+        painter.drawRoundedRect(self.rect(), PROGRESS_BAR_CORNER_RADIUS, PROGRESS_BAR_CORNER_RADIUS)
+
+        filled = self.width() * self._value // 100
+        if filled > 0:
+            painter.setBrush(self._chunk_color)
+            painter.drawRoundedRect(0, 0, filled, self.height(), PROGRESS_BAR_CORNER_RADIUS, PROGRESS_BAR_CORNER_RADIUS)
 
 
 class OverlayWindow(QWidget):
@@ -126,17 +327,44 @@ class OverlayWindow(QWidget):
         self.user_visibility_state = True
         self._is_playing = False
         self._last_np: NowPlaying | None = None
+        # Everything shown except the progress, so repeated polls of the same track are cheap.
+        self._last_sig: tuple[str | None, str | None, bool, int, str | None] | None = None
         self._last_art_url: str | None = None
-        self._art_loader_thread: ArtLoader | None = None
+        # Updates arriving in a burst are folded into one, applying only the latest.
+        self._pending_np: NowPlaying | None = None
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(NOW_PLAYING_COALESCE_MS)
+        # Recently shown covers keyed by (url, size), so resuming playback or
+        # returning to an album doesn't download and decode the art again.
+        self._art_cache: OrderedDict[tuple[str, int], QPixmap] = OrderedDict()
+        self._wanted_art_key: tuple[str, int] | None = None
+
+        # One worker thread serves every art load for the lifetime of the window.
+        self._art_thread = QThread(self)
+        self._art_thread.setObjectName("art-loader")
+        # Covers are disposable, so they go to the platform cache directory rather
+        # than next to config.toml (e.g. ~/.cache/Spoverlay/art on Linux).
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self._art_loader = ArtLoader(os.path.join(cache_root, ART_DISK_CACHE_DIR_NAME))
+        self._art_loader.moveToThread(self._art_thread)
+        _ = self._art_loader.art_loaded.connect(self._on_art_loaded)
+        self._art_thread.start()
         self._is_positioned = False
+        # Available geometry of the screen the overlay sits on, refreshed only when screens change.
+        self._screen_metrics: tuple[str, QRect] | None = None
+        self._watched_screen: QScreen | None = None
 
         self._title_label: QLabel
         self._artist_label: QLabel
         self._art_label: ArtLabel
-        self._progress_bar: QProgressBar
+        self._progress_bar: ProgressLine
         self._progress_timer = QTimer(self)
         self._progress_ms = 0
         self._duration_ms = 0
+        # Time since the last progress report from Spotify, so ticks don't accumulate drift.
+        self._progress_clock = QElapsedTimer()
+        self._progress_value = -1
 
         self._setup_window_properties()
         self._create_widgets()
@@ -146,9 +374,21 @@ class OverlayWindow(QWidget):
         if self._config.ui.click_through:
             self._setup_click_through()
 
+        self._app_positions_window = self._should_app_position_window()
+        if self._app_positions_window:
+            app = QGuiApplication.instance()
+            _ = app.screenAdded.connect(self._on_screens_changed)
+            _ = app.screenRemoved.connect(self._on_screen_removed)
+            _ = app.primaryScreenChanged.connect(self._on_screens_changed)
+
         self.show_placeholder("Connecting to Spotify…")
         self.user_visibility_state = self.isVisible()
 
+        # Moving to a screen with another scale factor needs the art at a new size.
+        handle = self.windowHandle()
+        if handle:
+            _ = handle.screenChanged.connect(self._on_window_screen_changed)
+
     def _setup_window_properties(self):
         """Sets the window flags, attributes, and size."""
 
@@ -178,9 +418,9 @@ class OverlayWindow(QWidget):
         self._artist_label = QLabel("Artist")
         self._artist_label.setObjectName("artist")
 
-        self._progress_bar = QProgressBar()
-        self._progress_bar.setTextVisible(False)
-        self._progress_bar.setMaximumHeight(PROGRESS_BAR_HEIGHT)
+        self._progress_bar = ProgressLine()
+        self._progress_bar.setObjectName("progress")
+        self._progress_bar.setFixedHeight(PROGRESS_BAR_HEIGHT)
 
     def _layout_widgets(self):
         """Arranges the created widgets using layouts."""
@@ -207,6 +447,7 @@ class OverlayWindow(QWidget):
         """Connects internal signals, like the progress timer."""
 
         _ = self._progress_timer.timeout.connect(self._progress_tick)
+        _ = self._apply_timer.timeout.connect(self._apply_pending_now_playing)
 
     @Slot()
     def clear_ui(self):
@@ -215,7 +456,9 @@ class OverlayWindow(QWidget):
         log.info("Clearing UI for re-authentication.")
         self.show_placeholder("Re-authenticating...")
         self._last_np = None
+        self._last_sig = None
         self._last_art_url = None
+        self._wanted_art_key = None
         self._is_playing = False
         self._stop_progress_timer()
 
@@ -246,7 +489,7 @@ class OverlayWindow(QWidget):
         if not screen:
             return
 
-        geometry = screen.availableGeometry()
+        geometry = self._available_geometry(screen)
         win_rect = self.frameGeometry()
         margin = self._config.ui.margin
         pos = self._config.ui.position
@@ -261,25 +504,52 @@ class OverlayWindow(QWidget):
         else:  # bottom-right
             x, y = geometry.x() + geometry.width() - win_rect.width() - margin, geometry.y() + geometry.height() - win_rect.height() - margin
 
-        self.move(x, y)
         self._is_positioned = True
+        # A move to the same spot still sends a move event and repaints the overlay.
+        if self.pos().x() == x and self.pos().y() == y:
+            return
+        self.move(x, y)
         log.info(f"Application positioned window at ({x}, {y}) for position '{pos}'.")
 
+    def _available_geometry(self, screen: QScreen) -> QRect:
+        """Returns the screen's available geometry, cached until the screen setup changes."""
+
+        name = screen.name()
+        if self._screen_metrics is None or self._screen_metrics[0] != name:
+            if self._watched_screen is not screen:
+                if self._watched_screen is not None:
+                    _ = self._watched_screen.availableGeometryChanged.disconnect(self._on_screens_changed)
+                _ = screen.availableGeometryChanged.connect(self._on_screens_changed)
+                self._watched_screen = screen
+            self._screen_metrics = (name, screen.availableGeometry())
+        return self._screen_metrics[1]
+
+    @Slot(QScreen)
+    def _on_screen_removed(self, screen: QScreen):
+        """Forgets a screen that is about to be destroyed, then repositions."""
+
+        # Its C++ object goes away after this signal, so it must not be disconnected later.
+        if screen is self._watched_screen:
+            self._watched_screen = None
+        self._on_screens_changed()
+
+    @Slot()
+    def _on_screens_changed(self):
+        """Drops the cached screen metrics and repositions the overlay if it is showing."""
+
+        self._screen_metrics = None
+        self._is_positioned = False
+        if self.isVisible():
+            self._position_window()
+
     @override
     def showEvent(self, event):  # pyright: ignore[reportMissingParameterType]
         """Overrides QWidget.showEvent to position the window on first show."""
 
         super().showEvent(event)
-        if self._should_app_position_window() and not self._is_positioned:
+        if self._app_positions_window and not self._is_positioned:
             QTimer.singleShot(0, self._position_window)
 
-    @override
-    def paintEvent(self, event):  # pyright: ignore[reportMissingParameterType]
-        """Overrides QWidget.paintEvent to ensure a transparent background."""
-
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
-
     def show_placeholder(self, text: str):
         """Displays a simple text message in the overlay."""
 
@@ -287,18 +557,50 @@ class OverlayWindow(QWidget):
         self._artist_label.setText("")
         self._progress_bar.hide()
         self._art_label.setPixmap(None)
+        self._last_sig = None
+        # A cover still downloading or a queued update must not land on top of the placeholder.
+        self._wanted_art_key = None
+        self._apply_timer.stop()
+        self._pending_np = None
         self.show()
 
     def get_last_now_playing(self) -> NowPlaying | None:
-        """Returns the last known 'NowPlaying' state."""
+        """Returns the last known 'NowPlaying' state, including one not yet applied."""
 
-        return self._last_np
+        return self._pending_np if self._apply_timer.isActive() else self._last_np
 
     @Slot(object)  # pyright: ignore[reportArgumentType]
     def set_now_playing(self, np: NowPlaying | None):
         """The main slot that receives updates from the SpotifyClient."""
 
+        self._pending_np = np
+        if not self._apply_timer.isActive():
+            self._apply_timer.start()
+
+    def refresh_from_last(self):
+        """Re-applies the last known state, e.g. after the user shows the overlay again."""
+
+        # A queued update is about to be applied anyway.
+        if not self._apply_timer.isActive():
+            self._apply_now_playing(self._last_np)
+
+    @Slot()
+    def _apply_pending_now_playing(self):
+        np, self._pending_np = self._pending_np, None
+        self._apply_now_playing(np)
+
+    def _apply_now_playing(self, np: NowPlaying | None):
+        """Updates the labels, progress, art and visibility for the given state."""
+
+        sig = (np.title, np.artist, np.is_playing, np.duration_ms, np.album_art_url) if np else None
         self._last_np = np
+
+        # Same track still playing and already on screen: only the progress can have moved.
+        if np and np.is_playing and sig == self._last_sig and self.user_visibility_state and self.isVisible():
+            self._update_progress_from_spotify(np.progress_ms, np.duration_ms)
+            return
+
+        self._last_sig = sig
         is_now_playing = bool(np and np.is_playing)
 
         # Start/stop the local progress timer based on playback state changes.
@@ -315,18 +617,25 @@ class OverlayWindow(QWidget):
             return
 
         if self._is_playing and np:
-            # Update UI elements with the new track data.
-            self._title_label.setText(_truncate_text(np.title or "", TITLE_MAX_LEN))
-            self._artist_label.setText(_truncate_text(np.artist or "", ARTIST_MAX_LEN))
-            self._progress_bar.show()
-            self._update_progress_from_spotify(np.progress_ms, np.duration_ms)
-
-            # Fetch new album art only if the URL has changed.
-            if np.album_art_url and np.album_art_url != self._last_art_url:
-                self._last_art_url = np.album_art_url
-                self._load_art_async(np.album_art_url)
-            elif not np.album_art_url:
-                self._art_label.setPixmap(None)
+            # Hold repaints until every widget is updated, then paint once.
+            self.setUpdatesEnabled(False)
+            try:
+                # Update UI elements with the new track data.
+                self._title_label.setText(_truncate_text(np.title or "", TITLE_MAX_LEN))
+                self._artist_label.setText(_truncate_text(np.artist or "", ARTIST_MAX_LEN))
+                self._progress_bar.show()
+                self._update_progress_from_spotify(np.progress_ms, np.duration_ms)
+
+                # Fetch new album art only if the URL has changed.
+                if np.album_art_url and np.album_art_url != self._last_art_url:
+                    self._last_art_url = np.album_art_url
+                    self._load_art_async(np.album_art_url)
+                elif not np.album_art_url:
+                    # The previous track's cover may still be on its way.
+                    self._wanted_art_key = None
+                    self._art_label.setPixmap(None)
+            finally:
+                self.setUpdatesEnabled(True)
 
             self.show()
         else:
@@ -334,54 +643,79 @@ class OverlayWindow(QWidget):
             self.hide()
             self._last_art_url = None
 
-    @Slot(QPixmap)
-    def _on_art_loaded(self, pixmap: QPixmap):
+    @Slot()
+    def _on_window_screen_changed(self):
+        if self._last_art_url:
+            self._load_art_async(self._last_art_url)
+
+    @Slot(str, int, QImage)
+    def _on_art_loaded(self, url: str, size: int, image: QImage):
         """Slot to receive the loaded album art from the background thread."""
 
-        self._art_label.setPixmap(pixmap)
+        key = (url, size)
+        pixmap = QPixmap.fromImage(image)
+        self._art_cache[key] = pixmap
+        if len(self._art_cache) > ART_CACHE_SIZE:
+            _ = self._art_cache.popitem(last=False)
+
+        # A cover that arrives after the track already changed is only cached.
+        if key == self._wanted_art_key:
+            self._art_label.setPixmap(pixmap)
 
     def _update_progress_from_spotify(self, progress_ms: int, duration_ms: int):
         """Resets the local progress based on data from Spotify."""
 
         self._progress_ms, self._duration_ms = progress_ms, duration_ms
-        self._update_progress_bar()
+        self._progress_clock.start()
+        self._update_progress_bar(progress_ms)
 
     def _start_progress_timer(self):
         if not self._progress_timer.isActive():
-            self._progress_timer.start(1000)
+            self._progress_timer.start(PROGRESS_TICK_MS)
 
     def _stop_progress_timer(self):
         if self._progress_timer.isActive():
             self._progress_timer.stop()
 
     def _progress_tick(self):
-        """Advances the progress bar every second."""
+        """Advances the progress bar by the time elapsed since Spotify's last report."""
 
         if not self._is_playing or self._duration_ms == 0:
             return
 
-        self._progress_ms += 1000
-        self._update_progress_bar()
+        self._update_progress_bar(self._progress_ms + self._progress_clock.elapsed())
 
-    def _update_progress_bar(self):
-        """Calculates and sets the progress bar's value (0-100)."""
+    def _update_progress_bar(self, progress_ms: int):
+        """Calculates the progress bar's value (0-100) and sets it only if it changed."""
 
-        if self._duration_ms > 0:
-            fraction = min(self._progress_ms / self._duration_ms, 1.0)
-            self._progress_bar.setValue(int(fraction * 100))
-        else:
-            self._progress_bar.setValue(0)
+        value = int(min(progress_ms / self._duration_ms, 1.0) * 100) if self._duration_ms > 0 else 0
+        if value != self._progress_value:
+            self._progress_value = value
+            self._progress_bar.setValue(value)
 
     def _load_art_async(self, url: str):
-        """Starts a background thread to download album art."""
+        """Asks the art loader thread for album art, unless it is cached."""
+
+        # Fetch at the screen's physical resolution so HiDPI covers aren't upscaled.
+        key = (url, round(self._config.ui.art_size * self.devicePixelRatioF()))
+        self._wanted_art_key = key
+
+        cached = self._art_cache.get(key)
+        if cached is not None:
+            self._art_cache.move_to_end(key)
+            self._art_label.setPixmap(cached)
+            return
+
+        self._art_loader.request(*key)
 
-        # Terminate any previous loader to prevent a race condition.
-        if self._art_loader_thread and self._art_loader_thread.isRunning():
-            self._art_loader_thread.terminate()
+    def stop_art_loader(self):
+        """Stops the art loader thread, waiting a bounded time for its current load."""
 
-        self._art_loader_thread = ArtLoader(url, self._config.ui.art_size)
-        _ = self._art_loader_thread.art_loaded.connect(self._on_art_loaded)
-        self._art_loader_thread.start()
+        self._art_thread.quit()
+        if not self._art_thread.wait(ART_LOADER_SHUTDOWN_TIMEOUT_MS):
+            log.warning("Album art download still running; not waiting for it.")
+            self._art_thread.setParent(None)
+            _abandoned_threads.append(self._art_thread)
 
     def on_config_changed(self, new_config: AppConfig):
         """Applies new configuration settings to the overlay window (hot-reload)."""
@@ -400,5 +734,5 @@ class OverlayWindow(QWidget):
 
         # Force a repositioning of the window with the new settings.
         self._is_positioned = False
-        if self.isVisible():
+        if self._app_positions_window and self.isVisible():
             self._position_window()
@@ -1,55 +1,61 @@
+import re
 from typing import final
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import (
-    QDialog,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QPushButton,
-    QVBoxLayout,
-    QFrame,
-    QSpacerItem,
-    QSizePolicy,
-)
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QFrame, QHBoxLayout, QLabel, QLineEdit, QPushButton, QVBoxLayout
+
+
+# Spotify Client IDs are 32 hex characters.
+CLIENT_ID_PATTERN = re.compile(r"[0-9a-f]{32}\Z", re.IGNORECASE)
+GROUP_SPACING = 12
 
 
 @final
 class SetupWindow(QDialog):
     """
     A dialog that prompts the user for their Spotify Client ID.
-    Inherits styling from the global qt_material theme.
+    Inherits styling from the global qt_material theme. Once accepted, the
+    validated ID is available as `client_id`.
     """
 
-    client_id_saved = Signal(str)
-
     def __init__(self):
         super().__init__()
+        self.client_id = ""
         self.setWindowTitle("Spoverlay - Setup")
         self.setFixedSize(500, 320)
         self.setWindowFlags(Qt.WindowType.Dialog)
 
+        # One stylesheet for the whole dialog, on top of the global theme.
+        self.setStyleSheet(
+            """
+            QLabel#title { font-weight: bold; font-size: 16pt; }
+            QLabel#subtitle { font-size: 11pt; }
+            QLabel#instructions { font-size: 10pt; }
+            QLabel#input_label { font-weight: bold; }
+            QLabel#error { color: #ff5555; font-size: 9pt; }
+            """
+        )
+
+        # Related rows sit close together; groups are separated by extra spacing.
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(24, 24, 24, 24)
-        main_layout.setSpacing(16)
-
-        header_layout = QVBoxLayout()
-        header_layout.setSpacing(4)
+        main_layout.setSpacing(4)
 
         title = QLabel("Welcome to Spoverlay")
-        title.setStyleSheet("font-weight: bold; font-size: 16pt;")
+        title.setObjectName("title")
 
         subtitle = QLabel("Before we start let's make sure you have your Client ID set up.")
-        subtitle.setStyleSheet("font-size: 11pt;")
+        subtitle.setObjectName("subtitle")
 
-        header_layout.addWidget(title)
-        header_layout.addWidget(subtitle)
-        main_layout.addLayout(header_layout)
+        main_layout.addWidget(title)
+        main_layout.addWidget(subtitle)
+        main_layout.addSpacing(GROUP_SPACING)
 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
         main_layout.addWidget(line)
+        main_layout.addSpacing(GROUP_SPACING)
 
         instructions = QLabel(
             """
@@ -58,30 +64,26 @@ class SetupWindow(QDialog):
             Please follow the <i>'Create Spotify App'</i> guide in the <a href='https://github.com/edryal/spoverlay#4-create-spotify-app'>README</a> to generate one.
             """
         )
+        instructions.setObjectName("instructions")
         instructions.setOpenExternalLinks(True)
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("font-size: 10pt;")
         main_layout.addWidget(instructions)
-
-        input_layout = QVBoxLayout()
-        input_layout.setSpacing(4)
+        main_layout.addSpacing(GROUP_SPACING)
 
         lbl_input = QLabel("Enter Client ID:")
-        lbl_input.setStyleSheet("font-weight: bold;")
+        lbl_input.setObjectName("input_label")
 
         self.client_id_input = QLineEdit()
         self.client_id_input.setPlaceholderText("e.g., 34a9b8d7...")
 
-        self.error_label = QLabel("Invalid Client ID (must be 32 characters)")
-        self.error_label.setStyleSheet("color: #ff5555; font-size: 9pt;")
+        self.error_label = QLabel("Invalid Client ID (must be 32 hex characters)")
+        self.error_label.setObjectName("error")
         self.error_label.hide()
 
-        input_layout.addWidget(lbl_input)
-        input_layout.addWidget(self.client_id_input)
-        input_layout.addWidget(self.error_label)
-        main_layout.addLayout(input_layout)
-
-        main_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        main_layout.addWidget(lbl_input)
+        main_layout.addWidget(self.client_id_input)
+        main_layout.addWidget(self.error_label)
+        main_layout.addStretch()
 
         button_layout = QHBoxLayout()
 
@@ -100,19 +102,23 @@ class SetupWindow(QDialog):
 
         main_layout.addLayout(button_layout)
 
-        _ = self.client_id_input.textChanged.connect(lambda: self.error_label.hide())
+        _ = self.client_id_input.textChanged.connect(self._on_text_changed)
+
+    def _on_text_changed(self, _text: str):
+        if self.error_label.isVisible():
+            self.error_label.hide()
 
     def _on_save(self):
         client_id = self.client_id_input.text().strip()
 
         """
-        Client IDs are 32 characters long so we'll check for that.
+        Client IDs are 32 hex characters long so we'll check for that.
         In case the ID was not fully copied. Classic user error.
         """
-        if len(client_id) != 32:
+        if not CLIENT_ID_PATTERN.match(client_id):
             self.client_id_input.setFocus()
             self.error_label.show()
             return
 
-        self.client_id_saved.emit(client_id)
+        self.client_id = client_id
         self.accept()
@@ -0,0 +1,98 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false, reportAny=false
+
+import json
+import logging
+import os
+from importlib.metadata import PackageNotFoundError, version
+
+from PySide6.QtCore import QDir
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QApplication
+
+
+THEME_EXTRA = {"density_scale": "-1"}
+ICON_SEARCH_PREFIX = "icon"
+
+log = logging.getLogger(__name__)
+
+
+def _cache_path(cache_dir: str, theme: str) -> str | None:
+    """Returns the cache file for this theme and qt_material version, or None if it can't be versioned."""
+
+    try:
+        qt_material_version = version("qt-material")
+    except PackageNotFoundError:
+        return None
+
+    theme_name = os.path.splitext(theme)[0]
+    return os.path.join(cache_dir, f"style-{theme_name}-{qt_material_version}.json")
+
+
+def _apply_cached(app: QApplication, cache_path: str) -> bool:
+    """Applies a previously generated theme. Returns False if the cache is missing or unusable."""
+
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as e:
+        log.warning(f"Failed to read cached theme, regenerating it. Error: {e}")
+        return False
+
+    # The generated icons and bundled fonts live outside the cache, make sure they are still there.
+    icon_paths: list[str] = cached.get("icon_paths", [])
+    font_files: list[str] = cached.get("font_files", [])
+    if not all(os.path.exists(path) for path in icon_paths + font_files):
+        return False
+
+    app.setStyle(cached["style"])
+    for font_file in font_files:
+        _ = QFontDatabase.addApplicationFont(font_file)
+    QDir.setSearchPaths(ICON_SEARCH_PREFIX, icon_paths)
+    app.setStyleSheet(cached["stylesheet"])
+    return True
+
+
+def _write_cache(app: QApplication, cache_path: str, font_files: list[str]):
+    """Stores everything qt_material set up so the next start can skip it."""
+
+    cached = {
+        "style": app.style().name(),
+        "stylesheet": app.styleSheet(),
+        "icon_paths": QDir.searchPaths(ICON_SEARCH_PREFIX),
+        "font_files": font_files,
+    }
+
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(cached, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log.warning(f"Failed to cache generated theme to {cache_path}: {e}")
+
+
+def apply_theme(app: QApplication, theme: str, cache_dir: str):
+    """
+    Applies a qt_material theme to the whole application. The generated
+    stylesheet is cached per qt_material version, so later starts don't have
+    to import qt_material or render its templates.
+    """
+
+    cache_path = _cache_path(cache_dir, theme)
+    if cache_path and _apply_cached(app, cache_path):
+        log.info("Application theme applied from cache.")
+        return
+
+    # Imported here so the (fairly heavy) qt_material import stays off the startup path.
+    import qt_material
+
+    qt_material.apply_stylesheet(app, theme, invert_secondary=False, extra=THEME_EXTRA)
+    log.info("Application theme applied.")
+
+    if cache_path:
+        fonts_dir = os.path.join(os.path.dirname(qt_material.__file__), "fonts")
+        font_files = [os.path.join(root, name) for root, _, names in os.walk(fonts_dir) for name in names if name.endswith(".ttf")]
+        _write_cache(app, cache_path, font_files)
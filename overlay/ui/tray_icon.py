@@ -1,16 +1,21 @@
 # pyright: reportAttributeAccessIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownParameterType=false, reportAny=false, reportPossiblyUnboundVariable=false, reportUnannotatedClassAttribute=false, reportUnknownArgumentType=false, reportOptionalMemberAccess=false
 
+import functools
 import logging
+import operator
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QAction, QDesktopServices, QIcon
+from PySide6.QtCore import QSize, QUrl, Signal
+from PySide6.QtGui import QAction, QDesktopServices, QIcon, QImageReader, QPixmap
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
 from overlay.core.models import AppConfig
 from overlay.core.spotify_client import SpotifyClient
-from overlay.ui.configure_window import ConfigureWindow
 from overlay.ui.overlay_window import OverlayWindow
 
+if TYPE_CHECKING:
+    from overlay.ui.configure_window import ConfigureWindow
+
 
 ACTION_TOGGLE_VISIBILITY = "Show Overlay"
 ACTION_CONFIGURE = "Configure"
@@ -18,9 +23,25 @@ ACTION_OPEN_DATA_DIR = "Open Data Directory"
 ACTION_RELOGIN = "Clear Cache && Relogin"
 ACTION_QUIT = "Quit"
 
+# Large enough for HiDPI trays, far smaller than the source image.
+TRAY_ICON_SIZE = 64
+
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_icon(icon_path: str) -> QIcon:
+    """Decodes the tray icon straight at tray size instead of at full resolution."""
+
+    reader = QImageReader(icon_path)
+    reader.setScaledSize(QSize(TRAY_ICON_SIZE, TRAY_ICON_SIZE))
+    image = reader.read()
+    if image.isNull():
+        log.warning(f"Failed to decode tray icon at {icon_path}: {reader.errorString()}")
+        return QIcon(icon_path)
+    return QIcon(QPixmap.fromImage(image))
+
+
 class TrayIcon(QSystemTrayIcon):
     """
     Manages the application's system tray icon, its context menu, and all
@@ -28,22 +49,38 @@ class TrayIcon(QSystemTrayIcon):
     re-authenticating, and accessing the configuration window.
     """
 
+    # (text, slot attribute path, checkable) per menu action; None adds a separator.
+    _MENU_SPEC = (
+        (ACTION_TOGGLE_VISIBILITY, "_on_toggle_visibility_from_menu", True),
+        (ACTION_CONFIGURE, "_show_configure_window", False),
+        None,
+        (ACTION_OPEN_DATA_DIR, "_open_data_directory", False),
+        None,
+        (ACTION_RELOGIN, "_on_relogin", False),
+        None,
+        (ACTION_QUIT, "_app.quit", False),
+    )
+
+    # Relays ConfigureWindow.config_saved, as that window is only built on first use.
+    config_saved = Signal(AppConfig)
+
     def __init__(self, app_name: str, icon_path: str, window: OverlayWindow, spotify_client: SpotifyClient, config: AppConfig):
         app_instance = QApplication.instance()
         super().__init__(app_instance)
 
+        self._app = app_instance
         self._window = window
         self._spotify_client = spotify_client
         self._config = config
 
-        self.setIcon(QIcon(icon_path))
+        self.setIcon(_load_icon(icon_path))
         self.setToolTip(app_name)
 
         self._user_wants_visible = window.isVisible()
         self._window.user_visibility_state = self._user_wants_visible
 
-        self.configure_window = ConfigureWindow(self._config)
-        self._toggle_action = QAction(ACTION_TOGGLE_VISIBILITY, self)
+        self.configure_window: ConfigureWindow | None = None
+        self._toggle_action: QAction
         self.setContextMenu(self._build_menu())
 
         _ = self.activated.connect(self._on_activated)
@@ -54,35 +91,27 @@ class TrayIcon(QSystemTrayIcon):
         """Creates and returns the context menu for the tray icon."""
 
         menu = QMenu()
+        for entry in self._MENU_SPEC:
+            if entry is None:
+                _ = menu.addSeparator()
+                continue
+
+            text, slot_path, checkable = entry
+            action = QAction(text, self)
+            if checkable:
+                action.setCheckable(True)
+                action.setChecked(self._user_wants_visible)
+                self._toggle_action = action
+            _ = action.triggered.connect(operator.attrgetter(slot_path)(self))
+            menu.addAction(action)
+
+        _ = menu.aboutToShow.connect(self._sync_toggle_action)
+        return menu
 
-        self._toggle_action.setCheckable(True)
-        self._toggle_action.setChecked(self._user_wants_visible)
-        _ = self._toggle_action.triggered.connect(self._on_toggle_visibility_from_menu)
-        menu.addAction(self._toggle_action)
-
-        configure_action = QAction(ACTION_CONFIGURE, self)
-        _ = configure_action.triggered.connect(self._show_configure_window)
-        menu.addAction(configure_action)
-
-        _ = menu.addSeparator()
-
-        open_dir_action = QAction(ACTION_OPEN_DATA_DIR, self)
-        _ = open_dir_action.triggered.connect(self._open_data_directory)
-        menu.addAction(open_dir_action)
-
-        _ = menu.addSeparator()
-
-        relogin_action = QAction(ACTION_RELOGIN, self)
-        _ = relogin_action.triggered.connect(self._on_relogin)
-        menu.addAction(relogin_action)
-
-        _ = menu.addSeparator()
-
-        quit_action = QAction(ACTION_QUIT, self)
-        _ = quit_action.triggered.connect(QApplication.instance().quit)
-        menu.addAction(quit_action)
+    def _sync_toggle_action(self):
+        """Refreshes the 'Show Overlay' checkbox right before the menu opens."""
 
-        return menu
+        self._toggle_action.setChecked(self._user_wants_visible)
 
     def _open_data_directory(self):
         """Opens the application's data directory in the system file explorer."""
@@ -105,17 +134,19 @@ class TrayIcon(QSystemTrayIcon):
 
     def _set_visibility_and_update_ui(self, new_state: bool):
         """
-        Updates the internal state, the menu checkbox, and the window itself.
+        Updates the internal state and the window itself. The menu checkbox
+        catches up when the menu is next shown.
         """
 
+        if new_state == self._user_wants_visible:
+            return
+
         self._user_wants_visible = new_state
         self._window.user_visibility_state = self._user_wants_visible
 
-        if self._toggle_action:
-            self._toggle_action.setChecked(new_state)
-
         if new_state:
-            self._window.set_now_playing(self._window.get_last_now_playing())
+            self._spotify_client.reset_poll_interval()
+            self._window.refresh_from_last()
         else:
             self._window.hide()
 
@@ -139,12 +170,16 @@ class TrayIcon(QSystemTrayIcon):
 
         self._user_wants_visible = was_visible_before_relogin
         self._window.user_visibility_state = was_visible_before_relogin
-        self._toggle_action.setChecked(was_visible_before_relogin)
 
     def _show_configure_window(self):
         """Shows the configuration window, ensuring it is raised to the front."""
 
         log.info("Opening configuration window.")
+        if self.configure_window is None:
+            from overlay.ui.configure_window import ConfigureWindow
+
+            self.configure_window = ConfigureWindow(self._config)
+            _ = self.configure_window.config_saved.connect(self.config_saved)
         self.configure_window.show()
         self.configure_window.raise_()
         self.configure_window.activateWindow()